@@ -127,6 +127,7 @@ from .xml_response import (
     XMLResponse,
     ResponseStatus,
     xml_response,
+    xml_responses,
     xml_success,
     xml_error,
     xml_warning,
@@ -327,6 +328,7 @@ __all__ = [
     # XML Response System (v6.0)
     "XMLResponse",
     "xml_response",
+    "xml_responses",
     "xml_success",
     "xml_error",
     "xml_warning",
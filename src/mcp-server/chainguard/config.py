@@ -9,11 +9,12 @@ See LICENSE file in the project root for full license information.
 """
 
 import os
+import sys
 import json
 import logging
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Dict, Set, Union, List, Any
 
@@ -496,6 +497,8 @@ DEBOUNCE_DELAY_SECONDS = 0.5
 GIT_CACHE_TTL_SECONDS = 300
 SYNTAX_CHECK_TIMEOUT_SECONDS = 10
 HTTP_REQUEST_TIMEOUT_SECONDS = 10
+# Hot dataclasses (state, responses) use __slots__ where supported (3.10+)
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 # Batch Limits
 MAX_BATCH_FILES = 50
@@ -602,9 +605,16 @@ class ChainguardConfig:
                 pass
         return cls()
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "validation_reminder_threshold": self.validation_reminder_threshold,
+            "max_log_entries": self.max_log_entries,
+            "cleanup_inactive_days": self.cleanup_inactive_days
+        }
+
     def save(self):
         with open(CHAINGUARD_HOME / "config.json", 'w') as f:
-            json.dump(asdict(self), f, indent=2)
+            json.dump(self.to_dict(), f, indent=2)
 
 
 # Global config instance
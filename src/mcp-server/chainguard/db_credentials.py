@@ -18,8 +18,8 @@ import base64
 import hashlib
 import uuid
 from pathlib import Path
-from typing import Optional, TYPE_CHECKING
-from dataclasses import dataclass, asdict
+from typing import Any, Dict, Optional, TYPE_CHECKING
+from dataclasses import dataclass
 
 from .config import logger
 
@@ -71,6 +71,16 @@ class StoredCredentials:
     database: str
     db_type: str
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "host": self.host,
+            "port": self.port,
+            "user": self.user,
+            "password_obfuscated": self.password_obfuscated,
+            "database": self.database,
+            "db_type": self.db_type
+        }
+
 
 class CredentialStore:
     """
@@ -115,7 +125,7 @@ class CredentialStore:
 
             path = self._get_path(working_dir)
             with open(path, 'w') as f:
-                json.dump(asdict(creds), f, indent=2)
+                json.dump(creds.to_dict(), f, indent=2)
 
             logger.info(f"DB credentials saved for {_project_hash(working_dir)}")
             return True
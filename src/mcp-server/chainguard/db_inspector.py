@@ -12,7 +12,7 @@ See LICENSE file in the project root for full license information.
 import asyncio
 import time
 import re
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields
 from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 
@@ -26,6 +26,9 @@ DB_MAX_TABLES = 50
 # SQL Injection Prevention: Allowed characters for identifiers
 IDENTIFIER_PATTERN = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_]*$')
 
+# Password characters known to cause trouble with some server configurations
+_PASSWORD_SPECIAL_CHARS = frozenset('!@#$%^&*()')
+
 
 def validate_identifier(name: str) -> bool:
     """
@@ -61,11 +64,28 @@ class DBConfig:
     db_type: str = "mysql"  # mysql, postgres, sqlite
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "host": self.host,
+            "port": self.port,
+            "user": self.user,
+            "password": self.password,
+            "database": self.database,
+            "db_type": self.db_type
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "DBConfig":
-        return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
+        # Fill the instance dict directly; unknown keys are ignored.
+        get = data.get
+        config = object.__new__(cls)
+        config.__dict__.update({k: get(k, v) for k, v in _DBCONFIG_DEFAULTS.items()})
+        return config
+
+
+# Field defaults, in declaration order, for DBConfig.from_dict
+_DBCONFIG_DEFAULTS: Dict[str, Any] = {
+    f.name: f.default for f in fields(DBConfig)
+}
 
 
 @dataclass
@@ -116,6 +136,8 @@ class DBInspector:
         self._schema: Optional[SchemaInfo] = None
         self._cache_ttl: int = DB_SCHEMA_CACHE_TTL
         self._connected: bool = False
+        # Last format_schema() body: (schema, version key, text)
+        self._format_cache: Optional[Tuple[SchemaInfo, Tuple[str, float, int], str]] = None
 
     def is_connected(self) -> bool:
         return self._connected and self._config is not None
@@ -157,7 +179,7 @@ class DBInspector:
 
         # Debug: Log password characteristics (not the password itself!)
         pw_len = len(config.password) if config.password else 0
-        pw_has_special = bool(config.password and any(c in config.password for c in '!@#$%^&*()'))
+        pw_has_special = not _PASSWORD_SPECIAL_CHARS.isdisjoint(config.password or "")
         logger.debug(f"MySQL connect: user={config.user}, db={config.database}, pw_len={pw_len}, pw_has_special={pw_has_special}")
 
         try:
@@ -206,7 +228,7 @@ class DBInspector:
 
         # Debug: Log password characteristics
         pw_len = len(config.password) if config.password else 0
-        pw_has_special = bool(config.password and any(c in config.password for c in '!@#$%^&*()'))
+        pw_has_special = not _PASSWORD_SPECIAL_CHARS.isdisjoint(config.password or "")
         logger.debug(f"Postgres connect: user={config.user}, db={config.database}, pw_len={pw_len}, pw_has_special={pw_has_special}")
 
         try:
@@ -659,32 +681,52 @@ class DBInspector:
         if not schema:
             return "Kein Schema geladen."
 
+        # The table listing only changes when the schema is (re)fetched,
+        # which bumps cached_at; the cache-age footer is always recomputed.
+        key = (schema.database, schema.cached_at, len(schema.tables))
+        cached = self._format_cache
+        if cached is not None and cached[0] is schema and cached[1] == key:
+            body = cached[2]
+        else:
+            body = self._format_schema_body(schema)
+            self._format_cache = (schema, key, body)
+
+        cache_age = int(time.time() - schema.cached_at) if schema.cached_at else 0
+        if cache_age > 0:
+            return f"{body}\n(Cache: {cache_age}s alt, TTL: {self._cache_ttl}s)"
+
+        return body
+
+    def _format_schema_body(self, schema: SchemaInfo) -> str:
+        """Render the table/column listing for format_schema."""
         lines = [f"📊 Database: {schema.database} ({schema.db_type} {schema.version})", ""]
+        append = lines.append
 
         for table_name, table in schema.tables.items():
-            lines.append(f"{table_name} ({len(table.columns)} cols, ~{table.row_count} rows)")
+            columns = table.columns
+            last = len(columns) - 1
+            append(f"{table_name} ({len(columns)} cols, ~{table.row_count} rows)")
 
-            for i, col in enumerate(table.columns):
-                prefix = "└─" if i == len(table.columns) - 1 else "├─"
+            for i, col in enumerate(columns):
+                prefix = "└─" if i == last else "├─"
 
                 flags = []
                 if col.key == "PRI":
                     flags.append("PK")
-                if "auto_increment" in col.extra.lower() or "serial" in col.extra.lower():
+                extra = col.extra.lower()
+                if "auto_increment" in extra or "serial" in extra:
                     flags.append("AUTO")
                 if col.key == "UNI":
                     flags.append("UNIQUE")
                 if col.fk_ref:
                     flags.append(f"FK→{col.fk_ref}")
 
-                flag_str = " " + " ".join(flags) if flags else ""
-                lines.append(f"{prefix} {col.name}: {col.type}{flag_str}")
-
-            lines.append("")
+                if flags:
+                    append(f"{prefix} {col.name}: {col.type} {' '.join(flags)}")
+                else:
+                    append(f"{prefix} {col.name}: {col.type}")
 
-        cache_age = int(time.time() - schema.cached_at) if schema.cached_at else 0
-        if cache_age > 0:
-            lines.append(f"(Cache: {cache_age}s alt, TTL: {self._cache_ttl}s)")
+            append("")
 
         return "\n".join(lines)
 
@@ -692,6 +734,7 @@ class DBInspector:
         """Clear connection and cache."""
         self._config = None
         self._schema = None
+        self._format_cache = None
         self._connected = False
 
 
@@ -703,13 +746,14 @@ _inspectors: Dict[str, DBInspector] = {}
 
 def get_inspector(project_id: str) -> DBInspector:
     """Get or create inspector for project."""
-    if project_id not in _inspectors:
-        _inspectors[project_id] = DBInspector()
-    return _inspectors[project_id]
+    inspector = _inspectors.get(project_id)
+    if inspector is None:
+        inspector = _inspectors[project_id] = DBInspector()
+    return inspector
 
 
 def clear_inspector(project_id: str):
-    """Clear inspector for project."""
-    if project_id in _inspectors:
-        _inspectors[project_id].clear()
-        del _inspectors[project_id]
+    """Clear inspector for project and drop it from the registry."""
+    inspector = _inspectors.pop(project_id, None)
+    if inspector is not None:
+        inspector.clear()
@@ -5158,7 +5158,13 @@ async def handle_kanban_update(args: Dict[str, Any]) -> List[TextContent]:
     if not card:
         return _text(f"✗ Card `{card_id}` not found")
 
-    return _text(f"✓ Card `{card_id}` updated\n  {card.title}")
+    response = f"✓ Card `{card_id}` updated\n  {card.title}"
+    if args.get("depends_on"):
+        cycle = kanban_manager.get_dependency_cycles(kanban_path)
+        if cycle:
+            response += f"\n\n⚠️ Zyklische Abhängigkeit: {', '.join(cycle)} (bleiben dauerhaft blockiert)"
+
+    return _text(response)
 
 
 @handler.register("chainguard_kanban_delete")
@@ -16,7 +16,7 @@ import json
 import asyncio
 from pathlib import Path
 from datetime import datetime
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field
 from typing import Dict, Any, List, Optional
 
 from .config import CHAINGUARD_HOME, logger
@@ -54,7 +54,16 @@ class HistoryEntry:
     fix_applied: Optional[str] = None # If error was fixed, describe how
 
     def to_dict(self) -> Dict[str, Any]:
-        return {k: v for k, v in asdict(self).items() if v is not None and v != ""}
+        data = {
+            "ts": self.ts,
+            "file": self.file,
+            "action": self.action,
+            "validation": self.validation,
+            "scope_id": self.scope_id,
+            "scope_desc": self.scope_desc,
+            "fix_applied": self.fix_applied
+        }
+        return {k: v for k, v in data.items() if v is not None and v != ""}
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "HistoryEntry":
@@ -73,7 +82,16 @@ class ErrorEntry:
     resolution: Optional[str] = None    # How it was fixed (if known)
 
     def to_dict(self) -> Dict[str, Any]:
-        return {k: v for k, v in asdict(self).items() if v is not None}
+        data = {
+            "ts": self.ts,
+            "file_pattern": self.file_pattern,
+            "error_type": self.error_type,
+            "error_msg": self.error_msg,
+            "scope_desc": self.scope_desc,
+            "project_id": self.project_id,
+            "resolution": self.resolution
+        }
+        return {k: v for k, v in data.items() if v is not None}
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ErrorEntry":
@@ -12,16 +12,25 @@ Licensed under the Polyform Noncommercial License 1.0.0
 """
 
 import os
+import json
 import uuid
+import tempfile
+from collections import deque
+from contextlib import contextmanager
 from pathlib import Path
-from dataclasses import dataclass, field, asdict
-from typing import Dict, List, Optional, Any
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 from datetime import datetime
 from enum import Enum
 
 try:
     import yaml
     YAML_AVAILABLE = True
+    # Prefer the libyaml-backed C loader when PyYAML was built with it
+    try:
+        from yaml import CSafeLoader as _YamlLoader
+    except ImportError:
+        from yaml import SafeLoader as _YamlLoader
 except ImportError:
     yaml = None
     YAML_AVAILABLE = False
@@ -51,6 +60,27 @@ COLUMN_PRESETS = {
 }
 
 
+# Icons used by the board views
+_PRIORITY_ICONS = {
+    "critical": "🔴",
+    "high": "🟠",
+    "medium": "🟡",
+    "low": "🟢"
+}
+_COLUMN_ICONS = {
+    "backlog": "📥",
+    "in_progress": "🔄",
+    "review": "👀",
+    "done": "✅"
+}
+_COLUMN_HEADERS = {
+    "backlog": ("📥", "BACKLOG"),
+    "in_progress": ("🔄", "IN PROGRESS"),
+    "review": ("👀", "REVIEW"),
+    "done": ("✅", "DONE")
+}
+
+
 # =============================================================================
 # Enums
 # =============================================================================
@@ -60,8 +90,9 @@ class CardPriority(str, Enum):
     HIGH = "high"
     CRITICAL = "critical"
 
-    def __str__(self) -> str:
-        return self.value
+    # The member *is* its value string; str.__str__ returns it without a
+    # Python-level call (same as enum.StrEnum on 3.11+).
+    __str__ = str.__str__
 
 
 # =============================================================================
@@ -96,18 +127,25 @@ class KanbanCard:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "KanbanCard":
-        """Create from dictionary."""
-        return cls(
-            id=data.get("id", str(uuid.uuid4())[:8]),
-            title=data.get("title", "Untitled"),
-            column=data.get("column", "backlog"),
-            priority=data.get("priority", "medium"),
-            detail_file=data.get("detail_file"),
-            depends_on=data.get("depends_on", []),
-            created_at=data.get("created_at", datetime.now().isoformat()),
-            updated_at=data.get("updated_at", datetime.now().isoformat()),
-            tags=data.get("tags", [])
-        )
+        """Create from dictionary.
+
+        Skips __init__ and fills the instance dict directly; fallback
+        ids and timestamps are only generated when the key is missing.
+        """
+        get = data.get
+        card = object.__new__(cls)
+        card.__dict__.update({
+            "id": data["id"] if "id" in data else str(uuid.uuid4())[:8],
+            "title": get("title", "Untitled"),
+            "column": get("column", "backlog"),
+            "priority": get("priority", "medium"),
+            "detail_file": get("detail_file"),
+            "depends_on": get("depends_on", []),
+            "created_at": data["created_at"] if "created_at" in data else datetime.now().isoformat(),
+            "updated_at": data["updated_at"] if "updated_at" in data else datetime.now().isoformat(),
+            "tags": get("tags", []),
+        })
+        return card
 
 
 @dataclass
@@ -129,13 +167,17 @@ class KanbanBoard:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "KanbanBoard":
-        """Create from dictionary."""
-        return cls(
-            columns=data.get("columns", DEFAULT_COLUMNS.copy()),
-            cards=[KanbanCard.from_dict(c) for c in data.get("cards", [])],
-            created_at=data.get("created_at", datetime.now().isoformat()),
-            updated_at=data.get("updated_at", datetime.now().isoformat())
-        )
+        """Create from dictionary (bypasses __init__, see KanbanCard.from_dict)."""
+        get = data.get
+        card_from_dict = KanbanCard.from_dict
+        board = object.__new__(cls)
+        board.__dict__.update({
+            "columns": data["columns"] if "columns" in data else DEFAULT_COLUMNS.copy(),
+            "cards": [card_from_dict(c) for c in get("cards", [])],
+            "created_at": data["created_at"] if "created_at" in data else datetime.now().isoformat(),
+            "updated_at": data["updated_at"] if "updated_at" in data else datetime.now().isoformat(),
+        })
+        return board
 
     def get_card(self, card_id: str) -> Optional[KanbanCard]:
         """Get a card by ID."""
@@ -144,10 +186,81 @@ class KanbanBoard:
                 return card
         return None
 
+    def remove_card(self, card_id: str) -> Optional[KanbanCard]:
+        """Remove and return the first card with this ID, or None."""
+        cards = self.cards
+        for i, card in enumerate(cards):
+            if card.id == card_id:
+                del cards[i]
+                return card
+        return None
+
     def get_cards_by_column(self, column: str) -> List[KanbanCard]:
         """Get all cards in a column."""
         return [c for c in self.cards if c.column == column]
 
+    def group_by_column(self) -> Dict[str, List[KanbanCard]]:
+        """Group cards by column in one pass.
+
+        Every board column is present (possibly empty); cards in unknown
+        columns are grouped under their own column name.
+        """
+        groups: Dict[str, List[KanbanCard]] = {column: [] for column in self.columns}
+        for card in self.cards:
+            group = groups.get(card.column)
+            if group is None:
+                group = groups[card.column] = []
+            group.append(card)
+        return groups
+
+    def find_dependency_cycles(self) -> List[str]:
+        """Return IDs of cards whose dependency chain loops back on itself.
+
+        Kahn's algorithm in O(cards + dependencies): cards are peeled off
+        once all their on-board dependencies are peeled; whatever remains
+        sits on a cycle or depends on one, and can never be unblocked.
+        Dependencies that are not on the board (archived/deleted) are ignored.
+        """
+        on_board = {card.id for card in self.cards}
+        indegree: Dict[str, int] = {}
+        dependents: Dict[str, List[str]] = {}
+        for card in self.cards:
+            deps = {dep for dep in card.depends_on or () if dep in on_board}
+            indegree[card.id] = len(deps)
+            for dep in deps:
+                dependents.setdefault(dep, []).append(card.id)
+
+        queue = deque(card_id for card_id, degree in indegree.items() if degree == 0)
+        while queue:
+            card_id = queue.popleft()
+            for dependent in dependents.get(card_id, ()):
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0:
+                    queue.append(dependent)
+
+        return [card.id for card in self.cards if indegree[card.id] > 0]
+
+
+# =============================================================================
+# Board Cache
+# =============================================================================
+# Parsed boards shared by all KanbanManager instances, keyed by kanban.yaml
+# path. Each entry remembers the file signature it was read at (None if the
+# file did not exist), so edits made outside this process force a reload.
+_BOARD_CACHE: Dict[str, Tuple[Optional[Tuple[int, int]], KanbanBoard]] = {}
+
+# Parsed archive.yaml contents, validated the same way
+_ARCHIVE_CACHE: Dict[str, Tuple[Optional[Tuple[int, int]], List[Dict[str, Any]]]] = {}
+
+
+def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    """Return (mtime_ns, size) for a file, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
 
 # =============================================================================
 # Kanban Manager
@@ -156,7 +269,11 @@ class KanbanManager:
     """Manages Kanban boards for projects."""
 
     def __init__(self):
-        self._boards: Dict[str, KanbanBoard] = {}
+        self._boards = _BOARD_CACHE
+        # Open batch() blocks per kanban.yaml path (nesting depth) and the
+        # board whose write is being held back until the outermost exits
+        self._batch_depth: Dict[str, int] = {}
+        self._pending_saves: Dict[str, KanbanBoard] = {}
 
     def _get_kanban_path(self, working_dir: str) -> Path:
         """Get the path to the kanban.yaml file."""
@@ -176,6 +293,62 @@ class KanbanManager:
         kanban_dir.mkdir(exist_ok=True)
         (kanban_dir / CARDS_DIR).mkdir(exist_ok=True)
 
+    def _read_yaml(self, path: Path) -> Any:
+        """Read and parse a YAML file. Errors propagate to the caller.
+
+        Files written by _write_yaml are JSON documents, which the json
+        module parses far faster than PyYAML; anything else (older block
+        style files, hand edits) goes through the YAML loader.
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            text = f.read()
+        if text.lstrip()[:1] in ('{', '['):
+            try:
+                return json.loads(text)
+            except ValueError:
+                pass
+        return yaml.load(text, Loader=_YamlLoader)
+
+    def _write_yaml(self, path: Path, data: Any) -> None:
+        """Serialize data to a YAML file. Errors propagate to the caller.
+
+        The document is written as indented JSON, which is valid YAML, so
+        the file stays readable and editable with any YAML tooling. It is
+        written to a uniquely named sibling temp file and moved into place,
+        so readers never see a half-written board and concurrent writers
+        never share a temp file.
+        """
+        text = json.dumps(data, indent=2, ensure_ascii=False, default=str)
+        f = tempfile.NamedTemporaryFile(
+            'w', encoding='utf-8', dir=path.parent,
+            prefix=path.name + ".", suffix=".tmp", delete=False
+        )
+        tmp_path = Path(f.name)
+        try:
+            with f:
+                f.write(text + "\n")
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def _load_archive(self, working_dir: str) -> List[Dict[str, Any]]:
+        """Load archived cards, re-parsing archive.yaml only when it changed.
+
+        The returned list is shared with the cache and must not be mutated.
+        Read/parse errors propagate to the caller.
+        """
+        archive_path = self._get_archive_path(working_dir)
+        cache_key = str(archive_path)
+        signature = _file_signature(archive_path)
+        cached = _ARCHIVE_CACHE.get(cache_key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        archive = (self._read_yaml(archive_path) or []) if signature is not None else []
+        _ARCHIVE_CACHE[cache_key] = (signature, archive)
+        return archive
+
     def load_board(self, working_dir: str) -> KanbanBoard:
         """Load or create a Kanban board for a project."""
         if not YAML_AVAILABLE:
@@ -184,16 +357,17 @@ class KanbanManager:
 
         kanban_path = self._get_kanban_path(working_dir)
 
-        # Check cache first
+        # Check cache first (valid while the file is unchanged on disk)
         cache_key = str(kanban_path)
-        if cache_key in self._boards:
-            return self._boards[cache_key]
+        signature = _file_signature(kanban_path)
+        cached = self._boards.get(cache_key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
 
         # Load from file or create new
-        if kanban_path.exists():
+        if signature is not None:
             try:
-                with open(kanban_path, 'r', encoding='utf-8') as f:
-                    data = yaml.safe_load(f) or {}
+                data = self._read_yaml(kanban_path) or {}
                 board = KanbanBoard.from_dict(data)
             except Exception as e:
                 logger.error(f"Failed to load kanban: {e}")
@@ -201,7 +375,7 @@ class KanbanManager:
         else:
             board = KanbanBoard()
 
-        self._boards[cache_key] = board
+        self._boards[cache_key] = (signature, board)
         return board
 
     def save_board(self, working_dir: str, board: KanbanBoard) -> None:
@@ -209,23 +383,55 @@ class KanbanManager:
         if not YAML_AVAILABLE:
             return
 
-        self._ensure_dirs(working_dir)
         kanban_path = self._get_kanban_path(working_dir)
-
         board.updated_at = datetime.now().isoformat()
 
+        if str(kanban_path) in self._batch_depth:
+            self._pending_saves[str(kanban_path)] = board
+            return
+
+        self._ensure_dirs(working_dir)
+
         try:
-            with open(kanban_path, 'w', encoding='utf-8') as f:
-                yaml.dump(board.to_dict(), f, default_flow_style=False, allow_unicode=True)
+            self._write_yaml(kanban_path, board.to_dict())
 
             # Update cache
-            self._boards[str(kanban_path)] = board
+            self._boards[str(kanban_path)] = (_file_signature(kanban_path), board)
         except Exception as e:
             logger.error(f"Failed to save kanban: {e}")
 
+    @contextmanager
+    def batch(self, working_dir: str) -> Iterator[KanbanBoard]:
+        """Defer board writes for a project until the block exits.
+
+        Card operations inside the block update the cached board as usual,
+        but save_board only records it; the board is written once when the
+        outermost batch for this project exits (also on error). Detail and
+        archive files are still written immediately.
+
+        Usage:
+            with kanban_manager.batch(working_dir):
+                for title in titles:
+                    kanban_manager.add_card(working_dir, title)
+        """
+        key = str(self._get_kanban_path(working_dir))
+        depth = self._batch_depth.get(key, 0)
+        self._batch_depth[key] = depth + 1
+        try:
+            yield self.load_board(working_dir)
+        finally:
+            if depth:
+                self._batch_depth[key] = depth
+            else:
+                del self._batch_depth[key]
+                pending = self._pending_saves.pop(key, None)
+                if pending is not None:
+                    self.save_board(working_dir, pending)
+
     def board_exists(self, working_dir: str) -> bool:
         """Check if a Kanban board exists for this project."""
-        return self._get_kanban_path(working_dir).exists()
+        kanban_path = self._get_kanban_path(working_dir)
+        return str(kanban_path) in self._pending_saves or kanban_path.exists()
 
     def init_board(
         self,
@@ -250,7 +456,7 @@ class KanbanManager:
         if columns:
             board_columns = columns
         elif preset and preset in COLUMN_PRESETS:
-            board_columns = COLUMN_PRESETS[preset]
+            board_columns = COLUMN_PRESETS[preset].copy()
         else:
             board_columns = DEFAULT_COLUMNS.copy()
 
@@ -284,7 +490,7 @@ class KanbanManager:
 
     def get_available_presets(self) -> dict:
         """Get all available column presets."""
-        return COLUMN_PRESETS.copy()
+        return {name: columns.copy() for name, columns in COLUMN_PRESETS.items()}
 
     # =========================================================================
     # Card Operations
@@ -326,6 +532,14 @@ class KanbanManager:
 
         return card
 
+    def add_cards(self, working_dir: str, specs: List[Dict[str, Any]]) -> List[KanbanCard]:
+        """Add several cards with a single board write.
+
+        Each spec holds add_card keyword arguments (``title`` required).
+        """
+        with self.batch(working_dir):
+            return [self.add_card(working_dir, **spec) for spec in specs]
+
     def move_card(self, working_dir: str, card_id: str, to_column: str) -> Optional[KanbanCard]:
         """Move a card to a different column."""
         board = self.load_board(working_dir)
@@ -346,20 +560,19 @@ class KanbanManager:
     def delete_card(self, working_dir: str, card_id: str) -> bool:
         """Delete a card permanently."""
         board = self.load_board(working_dir)
+        card = board.remove_card(card_id)
 
-        for i, card in enumerate(board.cards):
-            if card.id == card_id:
-                # Delete detail file if exists
-                if card.detail_file:
-                    detail_path = Path(working_dir) / KANBAN_DIR / card.detail_file
-                    if detail_path.exists():
-                        detail_path.unlink()
+        if not card:
+            return False
 
-                board.cards.pop(i)
-                self.save_board(working_dir, board)
-                return True
+        # Delete detail file if exists
+        if card.detail_file:
+            detail_path = Path(working_dir) / KANBAN_DIR / card.detail_file
+            if detail_path.exists():
+                detail_path.unlink()
 
-        return False
+        self.save_board(working_dir, board)
+        return True
 
     def archive_card(self, working_dir: str, card_id: str) -> bool:
         """Archive a card (move to archive.yaml)."""
@@ -372,15 +585,12 @@ class KanbanManager:
         if not card:
             return False
 
-        # Load archive
+        # Load archive (copy: the cached list is shared)
         archive_path = self._get_archive_path(working_dir)
-        archive = []
-        if archive_path.exists():
-            try:
-                with open(archive_path, 'r', encoding='utf-8') as f:
-                    archive = yaml.safe_load(f) or []
-            except Exception:
-                archive = []
+        try:
+            archive = list(self._load_archive(working_dir))
+        except Exception:
+            archive = []
 
         # Add to archive with timestamp
         archived_card = card.to_dict()
@@ -389,11 +599,11 @@ class KanbanManager:
 
         # Save archive
         self._ensure_dirs(working_dir)
-        with open(archive_path, 'w', encoding='utf-8') as f:
-            yaml.dump(archive, f, default_flow_style=False, allow_unicode=True)
+        self._write_yaml(archive_path, archive)
+        _ARCHIVE_CACHE[str(archive_path)] = (_file_signature(archive_path), archive)
 
         # Remove from board
-        board.cards = [c for c in board.cards if c.id != card_id]
+        board.remove_card(card_id)
         self.save_board(working_dir, board)
 
         return True
@@ -428,6 +638,10 @@ class KanbanManager:
 
         return card
 
+    def get_dependency_cycles(self, working_dir: str) -> List[str]:
+        """Get IDs of cards that are stuck in a dependency cycle."""
+        return self.load_board(working_dir).find_dependency_cycles()
+
     # =========================================================================
     # Detail Files
     # =========================================================================
@@ -450,12 +664,12 @@ class KanbanManager:
 
         detail_path = Path(working_dir) / KANBAN_DIR / card.detail_file
 
-        if not detail_path.exists():
-            return None
-
+        # Open directly - a missing file is the only expected failure
         try:
             with open(detail_path, 'r', encoding='utf-8') as f:
                 return f.read()
+        except FileNotFoundError:
+            return None
         except Exception as e:
             logger.error(f"Failed to read detail file: {e}")
             return None
@@ -481,32 +695,25 @@ class KanbanManager:
     # =========================================================================
     def get_board_view(self, working_dir: str, compact: bool = True) -> str:
         """Get a formatted view of the board."""
-        board = self.load_board(working_dir)
+        return self._render_board_view(self.load_board(working_dir), compact)
 
+    def _render_board_view(self, board: KanbanBoard, compact: bool = True) -> str:
+        """Render the board view for an already loaded board."""
         if not board.cards:
             return "📋 Kanban: Leer (nutze kanban_add um Cards zu erstellen)"
 
         lines = ["📋 **Kanban Board**\n"]
+        cards_by_column = board.group_by_column()
 
         for column in board.columns:
-            cards = board.get_cards_by_column(column)
-            column_icon = {
-                "backlog": "📥",
-                "in_progress": "🔄",
-                "review": "👀",
-                "done": "✅"
-            }.get(column, "📌")
+            cards = cards_by_column[column]
+            column_icon = _COLUMN_ICONS.get(column, "📌")
 
             lines.append(f"{column_icon} **{column.upper()}** ({len(cards)})")
 
             if cards:
                 for card in cards:
-                    priority_icon = {
-                        "critical": "🔴",
-                        "high": "🟠",
-                        "medium": "🟡",
-                        "low": "🟢"
-                    }.get(card.priority, "⚪")
+                    priority_icon = _PRIORITY_ICONS.get(card.priority, "⚪")
 
                     detail_marker = "📎" if card.detail_file else ""
                     deps_marker = f"⛓️{len(card.depends_on)}" if card.depends_on else ""
@@ -538,8 +745,9 @@ class KanbanManager:
 
         # Calculate statistics
         total = len(board.cards)
-        by_column = {col: len(board.get_cards_by_column(col)) for col in board.columns}
-        blocked = self.get_blocked_cards(working_dir)
+        groups = board.group_by_column()
+        by_column = {col: len(groups[col]) for col in board.columns}
+        blocked = self._blocked_cards(board)
         blocked_ids = {c.id for c in blocked}
 
         # Progress calculation
@@ -568,16 +776,9 @@ class KanbanManager:
         lines.append("╠" + "═" * 78 + "╣")
 
         # Render each column
-        column_icons = {
-            "backlog": ("📥", "BACKLOG"),
-            "in_progress": ("🔄", "IN PROGRESS"),
-            "review": ("👀", "REVIEW"),
-            "done": ("✅", "DONE")
-        }
-
         for column in board.columns:
-            icon, label = column_icons.get(column, ("📌", column.upper()))
-            cards = board.get_cards_by_column(column)
+            icon, label = _COLUMN_HEADERS.get(column, ("📌", column.upper()))
+            cards = groups[column]
 
             # Column header
             lines.append("║" + f" {icon} {label} ({len(cards)})".ljust(78) + "║")
@@ -618,14 +819,8 @@ class KanbanManager:
         """Render a single card with full details."""
         lines = []
 
-        # Priority icon and colors
-        priority_icons = {
-            "critical": "🔴",
-            "high": "🟠",
-            "medium": "🟡",
-            "low": "🟢"
-        }
-        p_icon = priority_icons.get(card.priority, "⚪")
+        # Priority icon
+        p_icon = _PRIORITY_ICONS.get(card.priority, "⚪")
 
         # Status indicators
         is_blocked = card.id in blocked_ids
@@ -696,8 +891,7 @@ class KanbanManager:
             return "📦 Archiv: Leer"
 
         try:
-            with open(archive_path, 'r', encoding='utf-8') as f:
-                archive = yaml.safe_load(f) or []
+            archive = self._load_archive(working_dir)
         except Exception:
             return "📦 Archiv: Fehler beim Laden"
 
@@ -722,27 +916,20 @@ class KanbanManager:
         - Is still in the board (not archived/deleted)
         - AND is not in the "done" column
         """
-        board = self.load_board(working_dir)
-        blocked = []
-
-        # IDs of cards that are done or no longer in the board
-        done_ids = {c.id for c in board.cards if c.column == "done"}
-        all_card_ids = {c.id for c in board.cards}
-
-        for card in board.cards:
-            if card.column == "done":
-                continue
-
-            if card.depends_on:
-                # Only consider dependencies that are still in the board and not done
-                unmet = [
-                    dep for dep in card.depends_on
-                    if dep in all_card_ids and dep not in done_ids
-                ]
-                if unmet:
-                    blocked.append(card)
-
-        return blocked
+        return self._blocked_cards(self.load_board(working_dir))
+
+    def _blocked_cards(self, board: KanbanBoard) -> List[KanbanCard]:
+        """Compute blocked cards for an already loaded board."""
+        # IDs that still block dependents: on the board and not done.
+        # Archived/deleted dependencies are simply absent from this set.
+        pending_ids = {c.id for c in board.cards if c.column != "done"}
+
+        return [
+            card for card in board.cards
+            if card.depends_on
+            and card.column != "done"
+            and not pending_ids.isdisjoint(card.depends_on)
+        ]
 
 
 # =============================================================================
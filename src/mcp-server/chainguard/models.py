@@ -8,20 +8,60 @@ Licensed under the Polyform Noncommercial License 1.0.0
 See LICENSE file in the project root for full license information.
 """
 
+import os
+import re
 import json
 import fnmatch
 from datetime import datetime
 from dataclasses import dataclass, field, asdict
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Pattern, Tuple
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 from .config import (
     CONFIG, MAX_RECENT_ACTIONS, MAX_OUT_OF_SCOPE_FILES,
     MAX_CHANGED_FILES, DB_SCHEMA_CHECK_TTL, DB_SCHEMA_PATTERNS,
-    TaskMode, get_mode_features
+    DATACLASS_SLOTS, TaskMode, get_mode_features
 )
 
 
-@dataclass
+if HAS_ORJSON:
+    # default=str and the options below keep the orjson output identical to
+    # the json fallback (str() of datetimes/sets, stringified non-str keys).
+    # Only float spelling can differ: orjson writes 1e16, json writes 1e+16.
+    _ORJSON_OPTIONS = (
+        orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    )
+
+
+@lru_cache(maxsize=64)
+def _compile_scope_modules(modules: Tuple[str, ...]) -> Tuple[Pattern[str], Pattern[str]]:
+    """
+    Compile scope module patterns into one glob matcher (applied to the
+    normcased path, like fnmatch.fnmatch) and one substring finder.
+    """
+    glob_re = re.compile("|".join(fnmatch.translate(os.path.normcase(p)) for p in modules))
+    substring_re = re.compile("|".join(re.escape(p) for p in modules))
+    return glob_re, substring_re
+
+
+# Web file extensions that REQUIRE HTTP testing (a tuple, for str.endswith)
+_WEB_EXTENSIONS = ('.php', '.js', '.ts', '.jsx', '.tsx', '.vue', '.html', '.twig', '.blade.php')
+
+
+@lru_cache(maxsize=4096)
+def _is_schema_file(file_path: str) -> bool:
+    """Cached DB_SCHEMA_PATTERNS check behind ProjectState.is_schema_file."""
+    file_lower = file_path.lower()
+    return any(pattern in file_lower for pattern in DB_SCHEMA_PATTERNS)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ScopeDefinition:
     """
     Defines the scope boundaries for a development task.
@@ -33,7 +73,7 @@ class ScopeDefinition:
     created_at: str = ""
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ProjectState:
     """
     Represents the complete state of a tracked project.
@@ -105,69 +145,36 @@ class ProjectState:
     symbol_warnings: List[str] = field(default_factory=list)
 
     def to_json(self) -> str:
-        return json.dumps(asdict(self), indent=2, default=str, ensure_ascii=False)
+        data = asdict(self)
+        if HAS_ORJSON:
+            return orjson.dumps(data, default=str, option=_ORJSON_OPTIONS).decode("utf-8")
+        return json.dumps(data, indent=2, default=str, ensure_ascii=False)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ProjectState":
-        if "scope" in data and data["scope"]:
-            data["scope"] = ScopeDefinition(**data["scope"])
+        # Only known fields are passed on; deprecated keys (progress_log,
+        # validation_history, learnings, ...) and old-format keys drop out here.
+        # Missing fields fall back to the dataclass defaults in __init__.
+        known_fields = cls.__dataclass_fields__
+        kwargs = {k: v for k, v in data.items() if k in known_fields}
+
+        if kwargs.get("scope"):
+            kwargs["scope"] = ScopeDefinition(**kwargs["scope"])
 
         # Migration from old format
-        if "files_modified" in data and isinstance(data["files_modified"], list):
-            data["files_changed"] = len(data["files_modified"])
-            del data["files_modified"]
-
-        # Remove deprecated fields
-        deprecated = [
-            "progress_log", "files_since_last_test", "validation_history",
-            "todos_completed", "expected_state", "learnings",
-            "file_dependencies", "_log_written_index"
-        ]
-        for key in deprecated:
-            data.pop(key, None)
+        files_modified = data.get("files_modified")
+        if isinstance(files_modified, list):
+            kwargs["files_changed"] = len(files_modified)
 
         # v4.18: Migrate db_schema_checked (bool) → db_schema_checked_at (timestamp)
         if "db_schema_checked" in data:
-            old_value = data.pop("db_schema_checked")
             # If it was True, set a timestamp (though it's likely stale now)
-            if old_value is True:
-                data["db_schema_checked_at"] = datetime.now().isoformat()
+            if data["db_schema_checked"] is True:
+                kwargs["db_schema_checked_at"] = datetime.now().isoformat()
             else:
-                data["db_schema_checked_at"] = ""
-
-        # Defaults for new fields
-        defaults = {
-            "files_changed": 0, "files_since_validation": 0,
-            "validations_passed": 0, "validations_failed": 0,
-            "recent_actions": [], "criteria_status": {},
-            "out_of_scope_files": [], "checklist_results": {},
-            "http_base_url": "", "http_credentials": {}, "http_tests_performed": 0,
-            "changed_files": [], "impact_check_pending": False,
-            # Test Runner (v4.10)
-            "test_config": {}, "test_results": {},
-            "last_test_run": "", "tests_passed": 0, "tests_failed": 0,
-            # Database Inspector (v4.12, v4.18: timestamp statt bool)
-            "db_config": {},
-            "db_schema_checked_at": "",
-            # Task Mode System (v5.0)
-            "task_mode": "programming",
-            "word_count_total": 0,
-            "chapter_status": {},
-            "command_history": [],
-            "checkpoints": [],
-            "sources": [],
-            "facts": [],
-            # Symbol Validation (v6.4.1)
-            "symbol_warnings": []
-        }
-        for key, value in defaults.items():
-            data.setdefault(key, value)
+                kwargs["db_schema_checked_at"] = ""
 
-        # Filter to only known fields
-        known_fields = {f.name for f in cls.__dataclass_fields__.values()}
-        filtered_data = {k: v for k, v in data.items() if k in known_fields}
-
-        return cls(**filtered_data)
+        return cls(**kwargs)
 
     def needs_validation(self) -> bool:
         return self.files_since_validation >= CONFIG.validation_reminder_threshold
@@ -177,24 +184,23 @@ class ProjectState:
         v4.18: Check if schema was checked and is still valid (within TTL).
         Returns True if schema was checked within DB_SCHEMA_CHECK_TTL seconds.
         """
-        if not self.db_schema_checked_at:
-            return False
-        try:
-            checked_at = datetime.fromisoformat(self.db_schema_checked_at)
-            age_seconds = (datetime.now() - checked_at).total_seconds()
-            return age_seconds < DB_SCHEMA_CHECK_TTL
-        except (ValueError, TypeError):
-            return False
+        age_seconds = self._schema_check_age_seconds()
+        return age_seconds is not None and age_seconds < DB_SCHEMA_CHECK_TTL
 
     def get_schema_check_age(self) -> int:
         """Get age of schema check in seconds, or -1 if never checked."""
+        age_seconds = self._schema_check_age_seconds()
+        return -1 if age_seconds is None else int(age_seconds)
+
+    def _schema_check_age_seconds(self) -> Optional[float]:
+        """Seconds since db_schema_checked_at, or None if unset/invalid."""
         if not self.db_schema_checked_at:
-            return -1
+            return None
         try:
             checked_at = datetime.fromisoformat(self.db_schema_checked_at)
-            return int((datetime.now() - checked_at).total_seconds())
-        except (ValueError, TypeError):
-            return -1
+            return (datetime.now() - checked_at).total_seconds()
+        except (ValueError, TypeError):  # TypeError: tz-aware timestamp
+            return None
 
     def invalidate_schema_check(self) -> bool:
         """
@@ -214,26 +220,27 @@ class ProjectState:
         """v4.18: Check if a file is a schema-related file."""
         if not file_path:
             return False
-        file_lower = file_path.lower()
-        return any(pattern in file_lower for pattern in DB_SCHEMA_PATTERNS)
+        return _is_schema_file(file_path)
 
     def check_file_in_scope(self, file_path: str) -> bool:
         """Check if file matches scope patterns."""
         if not self.scope or not self.scope.modules:
             return True
 
-        for pattern in self.scope.modules:
-            if fnmatch.fnmatch(file_path, pattern):
-                return True
-            if file_path.endswith(pattern) or pattern in file_path:
-                return True
-        return False
+        # A file is in scope if any module glob matches it or any module
+        # string occurs in its path (which also covers suffix matches).
+        glob_re, substring_re = _compile_scope_modules(tuple(self.scope.modules))
+        return (
+            glob_re.match(os.path.normcase(file_path)) is not None
+            or substring_re.search(file_path) is not None
+        )
 
     def add_action(self, action: str):
         """Add to recent actions - keeps only last MAX_RECENT_ACTIONS."""
-        self.recent_actions.append(f"{datetime.now().strftime('%H:%M')} {action}")
-        if len(self.recent_actions) > MAX_RECENT_ACTIONS:
-            self.recent_actions = self.recent_actions[-MAX_RECENT_ACTIONS:]
+        actions = self.recent_actions
+        actions.append(f"{datetime.now().strftime('%H:%M')} {action}")
+        if len(actions) > MAX_RECENT_ACTIONS:
+            del actions[:-MAX_RECENT_ACTIONS]  # trim in place, no list copy
 
     def get_status_line(self) -> str:
         """Ultra-compact one-line status."""
@@ -244,8 +251,9 @@ class ProjectState:
             flags.append(f"V!{self.files_since_validation}")
         if self.out_of_scope_files:
             flags.append(f"OOS:{len(self.out_of_scope_files)}")
-        if any(not a.get("ack") for a in self.alerts):
-            flags.append(f"A:{len([a for a in self.alerts if not a.get('ack')])}")
+        open_alert_count = sum(1 for a in self.alerts if not a.get("ack"))
+        if open_alert_count:
+            flags.append(f"A:{open_alert_count}")
 
         flag_str = f" [{','.join(flags)}]" if flags else ""
         scope_preview = (
@@ -259,11 +267,12 @@ class ProjectState:
     def get_completion_status(self) -> Dict[str, Any]:
         """Check if all requirements for task completion are fulfilled."""
         issues = []
+        criteria = self.scope.acceptance_criteria if self.scope else None
 
         # 1. Check acceptance criteria
-        if self.scope and self.scope.acceptance_criteria:
-            unfulfilled = [c for c in self.scope.acceptance_criteria
-                           if not self.criteria_status.get(c)]
+        unfulfilled = []
+        if criteria:
+            unfulfilled = [c for c in criteria if not self.criteria_status.get(c)]
             if unfulfilled:
                 issues.append({
                     "type": "criteria",
@@ -287,11 +296,19 @@ class ProjectState:
                     "message": f"{not_run} Checks nicht ausgeführt"
                 })
 
-        # 3. Check open alerts
-        open_alerts = [a for a in self.alerts if not a.get("ack")]
+        # 3. Check open alerts - one pass also collects blocking and syntax alerts
+        open_alerts = []
+        blocking_alerts = []  # v4.16: e.g. LOGIN_REQUIRED
+        has_syntax_alert = False
+        for a in self.alerts:
+            if a.get("ack"):
+                continue
+            open_alerts.append(a)
+            if a.get("blocking"):
+                blocking_alerts.append(a)
+            if "errors" in a:
+                has_syntax_alert = True
         if open_alerts:
-            # v4.16: Check for blocking alerts (e.g. LOGIN_REQUIRED)
-            blocking_alerts = [a for a in open_alerts if a.get("blocking")]
             if blocking_alerts:
                 issues.append({
                     "type": "blocking_alert",
@@ -307,8 +324,7 @@ class ProjectState:
                 })
 
         # 4. Check syntax errors in alerts
-        syntax_alerts = [a for a in self.alerts if not a.get("ack") and "errors" in a]
-        if syntax_alerts:
+        if has_syntax_alert:
             issues.append({
                 "type": "syntax",
                 "message": "Syntax-Fehler nicht behoben"
@@ -328,11 +344,8 @@ class ProjectState:
                 "blocking": False  # Can be bypassed with force=true
             })
 
-        criteria_total = len(self.scope.acceptance_criteria) if self.scope and self.scope.acceptance_criteria else 0
-        criteria_done = sum(
-            1 for c in (self.scope.acceptance_criteria if self.scope and self.scope.acceptance_criteria else [])
-            if self.criteria_status.get(c)
-        )
+        criteria_total = len(criteria) if criteria else 0
+        criteria_done = criteria_total - len(unfulfilled)
 
         return {
             "complete": len(issues) == 0,
@@ -343,17 +356,19 @@ class ProjectState:
 
     def add_changed_file(self, file_name: str):
         """Track a changed file for impact analysis."""
-        if file_name not in self.changed_files:
-            self.changed_files.append(file_name)
-            if len(self.changed_files) > MAX_CHANGED_FILES:
-                self.changed_files = self.changed_files[-MAX_CHANGED_FILES:]
+        files = self.changed_files
+        if file_name not in files:
+            files.append(file_name)
+            if len(files) > MAX_CHANGED_FILES:
+                del files[:-MAX_CHANGED_FILES]
 
     def add_out_of_scope_file(self, file_path: str):
         """Track an out-of-scope file."""
-        if file_path not in self.out_of_scope_files:
-            self.out_of_scope_files.append(file_path)
-            if len(self.out_of_scope_files) > MAX_OUT_OF_SCOPE_FILES:
-                self.out_of_scope_files = self.out_of_scope_files[-MAX_OUT_OF_SCOPE_FILES:]
+        files = self.out_of_scope_files
+        if file_path not in files:
+            files.append(file_path)
+            if len(files) > MAX_OUT_OF_SCOPE_FILES:
+                del files[:-MAX_OUT_OF_SCOPE_FILES]
 
     def _check_http_test_needed(self) -> Optional[Dict[str, Any]]:
         """
@@ -368,9 +383,6 @@ class ProjectState:
 
         Returns None if no issue (tests were done or no web files changed).
         """
-        # Web file extensions that REQUIRE HTTP testing
-        WEB_EXTENSIONS = {'.php', '.js', '.ts', '.jsx', '.tsx', '.vue', '.html', '.twig', '.blade.php'}
-
         # Skip if HTTP tests were already performed
         if self.http_tests_performed > 0:
             return None
@@ -385,13 +397,10 @@ class ProjectState:
             }
 
         # Check 2: ANY web file changed - BLOCKING
-        web_files_changed = []
-        for file_name in self.changed_files:
-            file_lower = file_name.lower()
-            for ext in WEB_EXTENSIONS:
-                if file_lower.endswith(ext):
-                    web_files_changed.append(file_name)
-                    break
+        web_files_changed = [
+            file_name for file_name in self.changed_files
+            if file_name.lower().endswith(_WEB_EXTENSIONS)
+        ]
 
         if web_files_changed:  # v4.15: ANY web file triggers requirement
             return {
@@ -408,7 +417,7 @@ class ProjectState:
             for action in self.recent_actions:
                 # Actions look like: "14:30 edit: user-edit.php" or "14:30 BATCH(3): edit"
                 action_lower = action.lower()
-                for ext in WEB_EXTENSIONS:
+                for ext in _WEB_EXTENSIONS:
                     if ext in action_lower:
                         # Extract filename from action
                         parts = action.split(': ')
@@ -430,7 +439,7 @@ class ProjectState:
             web_modules = []
             for module in self.scope.modules:
                 module_lower = module.lower()
-                for ext in WEB_EXTENSIONS:
+                for ext in _WEB_EXTENSIONS:
                     if ext in module_lower or module_lower.endswith(ext.replace('.', '')):
                         web_modules.append(module)
                         break
@@ -484,7 +493,7 @@ class ProjectState:
             "output": output[:500] if output else ""
         })
         if len(self.command_history) > 50:
-            self.command_history = self.command_history[-50:]
+            del self.command_history[:-50]
 
     def add_checkpoint(self, name: str, files: List[str] = None):
         """
@@ -497,7 +506,7 @@ class ProjectState:
             "files": files or []
         })
         if len(self.checkpoints) > 10:
-            self.checkpoints = self.checkpoints[-10:]
+            del self.checkpoints[:-10]
 
     def add_source(self, url: str, title: str = "", relevance: str = "medium"):
         """
@@ -511,7 +520,7 @@ class ProjectState:
             "ts": datetime.now().isoformat()
         })
         if len(self.sources) > 100:
-            self.sources = self.sources[-100:]
+            del self.sources[:-100]
 
     def add_fact(self, fact: str, source: str = "", confidence: str = "likely"):
         """
@@ -525,7 +534,7 @@ class ProjectState:
             "ts": datetime.now().isoformat()
         })
         if len(self.facts) > 200:
-            self.facts = self.facts[-200:]
+            del self.facts[:-200]
 
     def update_word_count(self, count: int):
         """v5.0: Update total word count (Content mode)."""
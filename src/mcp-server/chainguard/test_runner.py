@@ -13,7 +13,7 @@ import re
 import asyncio
 from pathlib import Path
 from datetime import datetime
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from typing import Dict, Any, List, Optional
 
 from .config import (
@@ -37,7 +37,12 @@ class TestConfig:
     working_dir: str = ""          # Optional: Überschreibt project_path
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "command": self.command,
+            "args": self.args,
+            "timeout": self.timeout,
+            "working_dir": self.working_dir
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "TestConfig":
@@ -66,7 +71,18 @@ class TestResult:
     exit_code: int = -1
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "success": self.success,
+            "passed": self.passed,
+            "failed": self.failed,
+            "total": self.total,
+            "duration": self.duration,
+            "framework": self.framework,
+            "output": self.output,
+            "error_lines": list(self.error_lines),
+            "timestamp": self.timestamp,
+            "exit_code": self.exit_code
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "TestResult":
@@ -8,7 +8,7 @@ Licensed under the Polyform Noncommercial License 1.0.0
 See LICENSE file in the project root for full license information.
 """
 
-from typing import List
+from typing import List, Optional
 
 try:
     from mcp.types import Tool
@@ -16,8 +16,30 @@ except ImportError:
     Tool = None  # Will fail at runtime if mcp not installed
 
 
+# Shared inputSchema for tools that only take an optional working_dir.
+# Referenced (not copied) by every such tool - treat as read-only.
+_SCHEMA_WORKING_DIR_ONLY = {
+    "type": "object",
+    "properties": {"working_dir": {"type": "string"}},
+    "required": []
+}
+
+# Tool definitions are static - built once on first request, then reused.
+# Nothing is materialized at import: all schemas are literals inside
+# _build_tool_definitions(), which first runs on the initial list_tools call.
+_TOOL_DEFINITIONS: Optional[List[Tool]] = None
+
+
 async def get_tool_definitions() -> List[Tool]:
-    """Return all tool definitions."""
+    """Return all tool definitions (cached after the first call)."""
+    global _TOOL_DEFINITIONS
+    if _TOOL_DEFINITIONS is None:
+        _TOOL_DEFINITIONS = _build_tool_definitions()
+    return _TOOL_DEFINITIONS
+
+
+def _build_tool_definitions() -> List[Tool]:
+    """Build all tool definitions."""
     return [
         # CORE: Scope Definition with Mode Selection
         Tool(
@@ -108,11 +130,7 @@ The mode determines which features are active (syntax validation, HTTP tests, et
         Tool(
             name="chainguard_context",
             description="Full context - USE SPARINGLY. Only when you need details.",
-            inputSchema={
-                "type": "object",
-                "properties": {"working_dir": {"type": "string"}},
-                "required": []
-            }
+            inputSchema=_SCHEMA_WORKING_DIR_ONLY
         ),
 
         # CORE: Phase Management
@@ -134,11 +152,7 @@ The mode determines which features are active (syntax validation, HTTP tests, et
         Tool(
             name="chainguard_run_checklist",
             description="Execute all checklist checks. Returns pass/fail summary.",
-            inputSchema={
-                "type": "object",
-                "properties": {"working_dir": {"type": "string"}},
-                "required": []
-            }
+            inputSchema=_SCHEMA_WORKING_DIR_ONLY
         ),
 
         # CORE: Mark Criteria
@@ -189,11 +203,7 @@ The mode determines which features are active (syntax validation, HTTP tests, et
         Tool(
             name="chainguard_clear_alerts",
             description="Acknowledge all alerts.",
-            inputSchema={
-                "type": "object",
-                "properties": {"working_dir": {"type": "string"}},
-                "required": []
-            }
+            inputSchema=_SCHEMA_WORKING_DIR_ONLY
         ),
 
         # ADMIN: List Projects
@@ -266,11 +276,7 @@ The mode determines which features are active (syntax validation, HTTP tests, et
         Tool(
             name="chainguard_clear_session",
             description="Clear stored session/cookies.",
-            inputSchema={
-                "type": "object",
-                "properties": {"working_dir": {"type": "string"}},
-                "required": []
-            }
+            inputSchema=_SCHEMA_WORKING_DIR_ONLY
         ),
 
         # Code Analysis
@@ -306,25 +312,13 @@ The mode determines which features are active (syntax validation, HTTP tests, et
         Tool(
             name="chainguard_run_tests",
             description="Run tests using configured command. Auto-detects PHPUnit/Jest/pytest output.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "working_dir": {"type": "string"}
-                },
-                "required": []
-            }
+            inputSchema=_SCHEMA_WORKING_DIR_ONLY
         ),
 
         Tool(
             name="chainguard_test_status",
             description="Show last test run status with errors.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "working_dir": {"type": "string"}
-                },
-                "required": []
-            }
+            inputSchema=_SCHEMA_WORKING_DIR_ONLY
         ),
 
         # Complete Task
@@ -436,25 +430,13 @@ The mode determines which features are active (syntax validation, HTTP tests, et
         Tool(
             name="chainguard_db_disconnect",
             description="Disconnect from database and clear schema cache.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "working_dir": {"type": "string"}
-                },
-                "required": []
-            }
+            inputSchema=_SCHEMA_WORKING_DIR_ONLY
         ),
 
         Tool(
             name="chainguard_db_forget",
             description="Delete saved DB credentials for this project. Use when password changed or to remove stored credentials.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "working_dir": {"type": "string"}
-                },
-                "required": []
-            }
+            inputSchema=_SCHEMA_WORKING_DIR_ONLY
         ),
 
         # =====================================================================
@@ -568,25 +550,13 @@ The mode determines which features are active (syntax validation, HTTP tests, et
         Tool(
             name="chainguard_sources",
             description="List all tracked sources (RESEARCH mode). Shows sources by relevance.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "working_dir": {"type": "string"}
-                },
-                "required": []
-            }
+            inputSchema=_SCHEMA_WORKING_DIR_ONLY
         ),
 
         Tool(
             name="chainguard_facts",
             description="List all indexed facts (RESEARCH mode). Shows facts by confidence.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "working_dir": {"type": "string"}
-                },
-                "required": []
-            }
+            inputSchema=_SCHEMA_WORKING_DIR_ONLY
         ),
 
         # =====================================================================
@@ -682,13 +652,7 @@ Actions:
         Tool(
             name="chainguard_memory_status",
             description="Show Long-Term Memory status and statistics. Shows indexed documents, storage size, and last update.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "working_dir": {"type": "string"}
-                },
-                "required": []
-            }
+            inputSchema=_SCHEMA_WORKING_DIR_ONLY
         ),
 
         Tool(
@@ -737,13 +701,7 @@ Examples:
         Tool(
             name="chainguard_detect_architecture",
             description="Detect architectural patterns in the codebase. Identifies MVC, MVVM, Clean Architecture, Layered, API-first, and more. Also detects framework (Laravel, Django, React, etc.).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "working_dir": {"type": "string"}
-                },
-                "required": []
-            }
+            inputSchema=_SCHEMA_WORKING_DIR_ONLY
         ),
 
         Tool(
@@ -780,13 +738,7 @@ Examples:
         Tool(
             name="chainguard_list_exports",
             description="List available memory export files.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "working_dir": {"type": "string"}
-                },
-                "required": []
-            }
+            inputSchema=_SCHEMA_WORKING_DIR_ONLY
         ),
 
         # HALLUCINATION PREVENTION: Symbol Validation
@@ -1060,12 +1012,6 @@ Shows a complete visual board including:
   - Blocked status if dependencies not met
 
 Use this for a complete overview of the current project state.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "working_dir": {"type": "string"}
-                },
-                "required": []
-            }
+            inputSchema=_SCHEMA_WORKING_DIR_ONLY
         )
     ]
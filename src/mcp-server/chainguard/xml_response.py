@@ -14,16 +14,182 @@ Copyright (c) 2026 Provimedia GmbH
 Licensed under the Polyform Noncommercial License 1.0.0
 """
 
-from typing import Dict, Any, List, Optional, Union
+import re
+import sys
+from functools import lru_cache
+from typing import Dict, Any, FrozenSet, Iterable, List, Optional, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
 import xml.etree.ElementTree as ET
 from xml.dom import minidom
+from xml.parsers import expat
+
+from .config import DATACLASS_SLOTS
 
 VERSION = "6.0"
 
+# Tag name sanitizing: separators become "_", anything else non-word is dropped
+# (\w == str.isalnum() or "_")
+_TAG_SEPARATORS = re.compile(r"[ .-]")
+_TAG_INVALID_CHARS = re.compile(r"\W")
+
+# Context keys rendered as <context> attributes, not child elements
+_SKIP_MODE = frozenset({"mode"})
+
+# ET.indent() is available from Python 3.9
+_HAS_ET_INDENT = hasattr(ET, "indent")
+
+# Escape tables - one C-level pass per string (same entities as ElementTree)
+_XML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+_XML_ATTR_ESCAPE = str.maketrans({
+    "&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;",
+    "\r": "&#13;", "\n": "&#10;", "\t": "&#09;"
+})
+
+
+def _escape_text(text: str) -> str:
+    """Escape XML text content."""
+    return text.translate(_XML_ESCAPE)
+
+
+def _escape_attr(text: str) -> str:
+    """Escape an XML attribute value (without surrounding quotes)."""
+    return text.translate(_XML_ATTR_ESCAPE)
+
+
+@lru_cache(maxsize=512)
+def _sanitize_tag_name(name: str) -> str:
+    """
+    Sanitize string to be valid XML tag name.
+
+    - Replace spaces with underscores
+    - Remove invalid characters
+    - Ensure starts with letter or underscore
+
+    Memoized: response keys come from a small, fixed vocabulary.
+    """
+    # Replace common separators
+    name = _TAG_SEPARATORS.sub("_", name)
+
+    # Remove invalid characters (keep alphanumeric and underscore)
+    name = _TAG_INVALID_CHARS.sub("", name)
+
+    # Ensure starts with letter or underscore
+    if name and not (name[0].isalpha() or name[0] == "_"):
+        name = "_" + name
+
+    return name or "item"
+
+
+def _to_text(value: Any) -> str:
+    """Convert value to XML text content."""
+    value_type = type(value)
+    if value_type is str:  # Most common case - already text
+        return value
+    if value is None:
+        return ""
+    if value_type is bool:
+        return "true" if value else "false"
+    return str(value)
+
+
+# =============================================================================
+# String Emitter (compact output)
+# =============================================================================
+# Same mapping rules as XMLResponse._dict_to_xml, but writes escaped markup
+# into a list[str] instead of building Element objects.
+
+def _emit_element(
+    out: List[str],
+    tag: str,
+    attrs: str,
+    data: Dict[str, Any],
+    skip: FrozenSet[str] = frozenset()
+) -> None:
+    """Append <tag attrs>...children...</tag> to out (self-closing if no children)."""
+    start = len(out)
+    out.append("")  # Placeholder for the opening tag
+    _emit_dict(out, data, skip)
+
+    if len(out) == start + 1:
+        out[start] = f"<{tag}{attrs} />"
+    else:
+        out[start] = f"<{tag}{attrs}>"
+        out.append(f"</{tag}>")
+
+
+def _emit_text(out: List[str], tag: str, text: str) -> None:
+    """Append a leaf element with escaped text content."""
+    if text:
+        out.append(f"<{tag}>{_escape_text(text)}</{tag}>")
+    else:
+        out.append(f"<{tag} />")
+
+
+def _emit_dict_value(out: List[str], tag: str, value: Dict[str, Any]) -> None:
+    """Nested dict -> nested element (attributes via special _attrs key)."""
+    attrs = ""
+    if "_attrs" in value:
+        attrs = "".join(
+            f' {attr_key}="{_escape_attr(str(attr_val))}"'
+            for attr_key, attr_val in value["_attrs"].items()
+        )
+    _emit_element(out, tag, attrs, value)
+
 
-class ResponseStatus(str, Enum):
+def _emit_seq_value(out: List[str], tag: str, value: Union[list, tuple]) -> None:
+    """List/tuple -> repeated elements with the same tag."""
+    for item in value:
+        if isinstance(item, dict):
+            _emit_element(out, tag, "", item)
+        else:
+            _emit_text(out, tag, _to_text(item))
+
+
+def _emit_leaf_value(out: List[str], tag: str, value: Any) -> None:
+    """Primitive -> text content (None -> empty element)."""
+    _emit_text(out, tag, _to_text(value))
+
+
+# Exact-type dispatch; subclasses are resolved once via _resolve_emitter()
+_VALUE_EMITTERS = {
+    dict: _emit_dict_value,
+    list: _emit_seq_value,
+    tuple: _emit_seq_value,
+}
+
+
+def _resolve_emitter(value: Any):
+    """Fallback dispatch for types not in _VALUE_EMITTERS (e.g. dict subclasses)."""
+    if isinstance(value, dict):
+        return _emit_dict_value
+    if isinstance(value, (list, tuple)):
+        return _emit_seq_value
+    return _emit_leaf_value
+
+
+def _emit_dict(out: List[str], data: Dict[str, Any], skip: FrozenSet[str] = frozenset()) -> None:
+    """Append dictionary contents as XML strings to out (keys in skip are ignored)."""
+    for key, value in data.items():
+        # Skip internal keys
+        if key.startswith("_") or key in skip:
+            continue
+
+        emit = _VALUE_EMITTERS.get(type(value)) or _resolve_emitter(value)
+        emit(out, _sanitize_tag_name(key), value)
+
+
+if sys.version_info >= (3, 11):
+    from enum import StrEnum as _StrEnum
+else:
+    class _StrEnum(str, Enum):
+        """Backport of enum.StrEnum: str() returns the member value."""
+
+        def __str__(self) -> str:
+            return self.value
+
+
+class ResponseStatus(_StrEnum):
     """Response status types for XML responses."""
     SUCCESS = "success"
     ERROR = "error"
@@ -31,11 +197,55 @@ class ResponseStatus(str, Enum):
     INFO = "info"
     BLOCKED = "blocked"
 
-    def __str__(self) -> str:
-        return self.value
 
+@lru_cache(maxsize=128)
+def _open_tag(tool: str) -> str:
+    """Root opening tag - depends only on the tool name (a small, closed set)."""
+    return f'<chainguard tool="{_escape_attr(tool)}" version="{VERSION}">'
+
+
+def _emit(
+    tool: str,
+    status: ResponseStatus,
+    message: str = "",
+    data: Optional[Dict[str, Any]] = None,
+    context: Optional[Dict[str, Any]] = None
+) -> str:
+    """
+    Compact single-pass serialization - no Element objects.
+
+    The document skeleton is a fixed template; only data/context
+    need the recursive emitter. Used by XMLResponse.to_xml() and
+    directly by the convenience functions (no wrapper object).
+    """
+    # Enum values are fixed, markup-safe literals - no str()/escape needed
+    status_text = status.value if type(status) is ResponseStatus else _escape_text(str(status))
+
+    head = f"{_open_tag(tool)}<status>{status_text}</status>"
+    if message:
+        head += f"<message>{_escape_text(message)}</message>"
+
+    if not data and not context:
+        return head + "</chainguard>"
+
+    out: List[str] = [head]
+
+    if data:
+        _emit_element(out, "data", "", data)
+
+    if context:
+        if isinstance(context, dict) and "mode" in context:
+            mode_attr = f' mode="{_escape_attr(str(context.get("mode", "")))}"'
+            # Skip mode in the children to avoid duplication
+            _emit_element(out, "context", mode_attr, context, _SKIP_MODE)
+        else:
+            _emit_element(out, "context", "", context)
 
-@dataclass
+    out.append("</chainguard>")
+    return "".join(out)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class XMLResponse:
     """
     Structured XML response builder for Chainguard MCP.
@@ -58,45 +268,60 @@ class XMLResponse:
 
     def to_xml(self) -> str:
         """Generate XML string from response data."""
-        root = ET.Element("chainguard", tool=self.tool, version=VERSION)
+        if self.pretty:
+            return self._to_pretty_xml()
+        return _emit(self.tool, self.status, self.message, self.data, self.context)
+
+    def _to_pretty_xml(self) -> str:
+        """Generate indented XML via ElementTree (costs more tokens)."""
+        # TreeBuilder start/data/end are C methods - no per-node SubElement calls
+        tb = ET.TreeBuilder()
+        tb.start("chainguard", {"tool": self.tool, "version": VERSION})
 
         # Status element (required)
-        status_el = ET.SubElement(root, "status")
-        status_el.text = str(self.status)
+        self._leaf_to_xml(tb, "status", str(self.status))
 
         # Message element (optional)
         if self.message:
-            msg_el = ET.SubElement(root, "message")
-            msg_el.text = self.message
+            self._leaf_to_xml(tb, "message", self.message)
 
         # Data element (optional)
         if self.data:
-            data_el = ET.SubElement(root, "data")
-            self._dict_to_xml(data_el, self.data)
+            tb.start("data", {})
+            self._dict_to_xml(tb, self.data)
+            tb.end("data")
 
         # Context element (optional)
         if self.context:
-            ctx_el = ET.SubElement(root, "context")
             if isinstance(self.context, dict) and "mode" in self.context:
-                ctx_el.set("mode", str(self.context.get("mode", "")))
-                # Remove mode from dict to avoid duplication
-                context_copy = {k: v for k, v in self.context.items() if k != "mode"}
-                self._dict_to_xml(ctx_el, context_copy)
+                tb.start("context", {"mode": str(self.context.get("mode", ""))})
+                # Skip mode in the children to avoid duplication
+                self._dict_to_xml(tb, self.context, _SKIP_MODE)
             else:
-                self._dict_to_xml(ctx_el, self.context)
+                tb.start("context", {})
+                self._dict_to_xml(tb, self.context)
+            tb.end("context")
 
-        # Generate XML string
-        xml_str = ET.tostring(root, encoding="unicode")
+        tb.end("chainguard")
+        root = tb.close()
 
-        if self.pretty:
-            # Pretty print with indentation (costs more tokens)
-            return minidom.parseString(xml_str).toprettyxml(indent="  ")
+        if _HAS_ET_INDENT:
+            # Indent the tree in place - no serialize/re-parse round trip
+            ET.indent(root, space="  ")
+            return f'<?xml version="1.0" ?>\n{ET.tostring(root, encoding="unicode")}\n'
 
-        return xml_str
-
-    def _dict_to_xml(self, parent: ET.Element, data: Dict[str, Any]) -> None:
+        # Python 3.8 fallback
+        xml_str = ET.tostring(root, encoding="unicode")
+        return minidom.parseString(xml_str).toprettyxml(indent="  ")
+
+    def _dict_to_xml(
+        self,
+        tb: ET.TreeBuilder,
+        data: Dict[str, Any],
+        skip: FrozenSet[str] = frozenset()
+    ) -> None:
         """
-        Recursively convert dictionary to XML elements.
+        Recursively feed dictionary contents into a TreeBuilder.
 
         Handles:
         - Nested dicts -> nested elements
@@ -104,62 +329,44 @@ class XMLResponse:
         - Primitives -> text content
         - None -> empty element
         - Attributes via special _attrs key
+        - Keys listed in skip are ignored
         """
         for key, value in data.items():
             # Skip internal keys
-            if key.startswith("_"):
+            if key.startswith("_") or key in skip:
                 continue
 
             # Sanitize key for XML (no spaces, special chars)
-            safe_key = self._sanitize_tag_name(key)
+            safe_key = _sanitize_tag_name(key)
 
             if isinstance(value, dict):
-                child = ET.SubElement(parent, safe_key)
+                attrs = {}
                 # Handle attributes if present
                 if "_attrs" in value:
-                    for attr_key, attr_val in value["_attrs"].items():
-                        child.set(attr_key, str(attr_val))
-                self._dict_to_xml(child, value)
+                    attrs = {k: str(v) for k, v in value["_attrs"].items()}
+                tb.start(safe_key, attrs)
+                self._dict_to_xml(tb, value)
+                tb.end(safe_key)
 
             elif isinstance(value, (list, tuple)):
                 for item in value:
-                    child = ET.SubElement(parent, safe_key)
                     if isinstance(item, dict):
-                        self._dict_to_xml(child, item)
+                        tb.start(safe_key, {})
+                        self._dict_to_xml(tb, item)
+                        tb.end(safe_key)
                     else:
-                        child.text = self._to_text(item)
+                        self._leaf_to_xml(tb, safe_key, _to_text(item))
 
             else:
-                child = ET.SubElement(parent, safe_key)
-                child.text = self._to_text(value)
-
-    def _sanitize_tag_name(self, name: str) -> str:
-        """
-        Sanitize string to be valid XML tag name.
-
-        - Replace spaces with underscores
-        - Remove invalid characters
-        - Ensure starts with letter or underscore
-        """
-        # Replace common separators
-        name = name.replace(" ", "_").replace("-", "_").replace(".", "_")
+                self._leaf_to_xml(tb, safe_key, _to_text(value))
 
-        # Remove invalid characters (keep alphanumeric and underscore)
-        name = "".join(c for c in name if c.isalnum() or c == "_")
-
-        # Ensure starts with letter or underscore
-        if name and not (name[0].isalpha() or name[0] == "_"):
-            name = "_" + name
-
-        return name or "item"
-
-    def _to_text(self, value: Any) -> str:
-        """Convert value to XML text content."""
-        if value is None:
-            return ""
-        if isinstance(value, bool):
-            return "true" if value else "false"
-        return str(value)
+    @staticmethod
+    def _leaf_to_xml(tb: ET.TreeBuilder, tag: str, text: str) -> None:
+        """Feed a text-only element into a TreeBuilder."""
+        tb.start(tag, {})
+        if text:
+            tb.data(text)
+        tb.end(tag)
 
 
 # =============================================================================
@@ -196,14 +403,16 @@ def xml_response(
             data={"scope": {"description": "Feature X"}}
         )
     """
-    return XMLResponse(
-        tool=tool,
-        status=status,
-        message=message,
-        data=data,
-        context=context,
-        pretty=pretty
-    ).to_xml()
+    if pretty:
+        return XMLResponse(
+            tool=tool,
+            status=status,
+            message=message,
+            data=data,
+            context=context,
+            pretty=True
+        ).to_xml()
+    return _emit(tool, status, message, data, context)
 
 
 def xml_success(
@@ -213,7 +422,7 @@ def xml_success(
     context: Optional[Dict[str, Any]] = None
 ) -> str:
     """Create a success XML response."""
-    return xml_response(tool, ResponseStatus.SUCCESS, message, data, context)
+    return _emit(tool, ResponseStatus.SUCCESS, message, data, context)
 
 
 def xml_error(
@@ -222,7 +431,7 @@ def xml_error(
     data: Optional[Dict[str, Any]] = None
 ) -> str:
     """Create an error XML response."""
-    return xml_response(tool, ResponseStatus.ERROR, message, data)
+    return _emit(tool, ResponseStatus.ERROR, message, data)
 
 
 def xml_warning(
@@ -231,7 +440,7 @@ def xml_warning(
     data: Optional[Dict[str, Any]] = None
 ) -> str:
     """Create a warning XML response."""
-    return xml_response(tool, ResponseStatus.WARNING, message, data)
+    return _emit(tool, ResponseStatus.WARNING, message, data)
 
 
 def xml_info(
@@ -240,7 +449,7 @@ def xml_info(
     data: Optional[Dict[str, Any]] = None
 ) -> str:
     """Create an info XML response."""
-    return xml_response(tool, ResponseStatus.INFO, message, data)
+    return _emit(tool, ResponseStatus.INFO, message, data)
 
 
 def xml_blocked(
@@ -272,7 +481,35 @@ def xml_blocked(
             **(blocker_data or {})
         }
     }
-    return xml_response(tool, ResponseStatus.BLOCKED, message, data)
+    return _emit(tool, ResponseStatus.BLOCKED, message, data)
+
+
+def xml_responses(
+    items: Iterable[Tuple[Any, ...]],
+    wrap_tag: str = "results"
+) -> str:
+    """
+    Emit several responses as one XML document.
+
+    Each item is a tuple of xml_response() arguments:
+    (tool, status[, message[, data[, context]]]). All responses are
+    written into one shared buffer and wrapped in a single root element.
+
+    Example:
+        xml = xml_responses([
+            ("kanban_add", ResponseStatus.SUCCESS, "Card added", {"id": "a1"}),
+            ("kanban_add", ResponseStatus.ERROR, "Title missing"),
+        ])
+    """
+    tag = _sanitize_tag_name(wrap_tag)
+    out: List[str] = [f"<{tag}>"]
+    out.extend(_emit(*item) for item in items)
+
+    if len(out) == 1:
+        return f"<{tag} />"
+
+    out.append(f"</{tag}>")
+    return "".join(out)
 
 
 # =============================================================================
@@ -306,6 +543,10 @@ def build_context(
             features={"syntax_validation": True}
         )
     """
+    # Common case: mode only - skip the optional-section checks
+    if not (rules or features or hints):
+        return {"mode": mode}
+
     context: Dict[str, Any] = {"mode": mode}
 
     if rules:
@@ -324,12 +565,28 @@ def build_context(
 # Validation
 # =============================================================================
 
+class _UndefinedEntity(Exception):
+    """Raised by the validating parser for entities ET.fromstring rejects."""
+
+
+def _reject_entity(*args: Any) -> int:
+    raise _UndefinedEntity()
+
+
 def is_valid_xml(xml_string: str) -> bool:
-    """Check if string is valid XML."""
+    """Check if string is valid XML.
+
+    Runs expat directly without building a tree. Namespace processing and
+    the entity handlers keep the verdict identical to ET.fromstring
+    (unbound prefixes, external and undeclared entities are errors there).
+    """
+    parser = expat.ParserCreate(namespace_separator="}")
+    parser.ExternalEntityRefHandler = _reject_entity
+    parser.SkippedEntityHandler = _reject_entity
     try:
-        ET.fromstring(xml_string)
+        parser.Parse(xml_string, True)
         return True
-    except ET.ParseError:
+    except (expat.ExpatError, _UndefinedEntity):
         return False
 
 
@@ -346,30 +603,51 @@ def parse_xml_response(xml_string: str) -> Optional[Dict[str, Any]]:
         return None
 
 
-def _xml_to_dict(element: ET.Element) -> Dict[str, Any]:
-    """Convert XML element to dict (recursive)."""
-    result: Dict[str, Any] = {}
-
+def _xml_node(element: ET.Element) -> Union[Dict[str, Any], str]:
+    """Start a node's value: attributes + text (plain string for text-only leaves)."""
     # Add attributes
-    if element.attrib:
-        result["_attrs"] = dict(element.attrib)
+    attrib = element.attrib
+    result: Dict[str, Any] = {"_attrs": dict(attrib)} if attrib else {}
 
     # Add text content
-    if element.text and element.text.strip():
-        if len(element) == 0:  # No children
-            return element.text.strip()
-        result["_text"] = element.text.strip()
-
-    # Add children
-    for child in element:
-        child_data = _xml_to_dict(child)
-
-        if child.tag in result:
-            # Convert to list if multiple same-tag children
-            if not isinstance(result[child.tag], list):
-                result[child.tag] = [result[child.tag]]
-            result[child.tag].append(child_data)
-        else:
-            result[child.tag] = child_data
+    text = element.text
+    if text:
+        text = text.strip()
+        if text:
+            if not len(element):  # No children
+                return text
+            result["_text"] = text
 
     return result
+
+
+def _xml_to_dict(element: ET.Element) -> Dict[str, Any]:
+    """Convert XML element to dict (iterative - explicit stack, no recursion)."""
+    root = _xml_node(element)
+    if type(root) is str:
+        return root
+
+    stack = [(root, iter(element))]
+    while stack:
+        result, children = stack[-1]
+        # Resume this level's iterator; descend on the first child with children
+        for child in children:
+            child_data = _xml_node(child)
+            tag = child.tag
+
+            if tag not in result:
+                result[tag] = child_data
+            elif type(result[tag]) is list:
+                result[tag].append(child_data)
+            else:
+                # Convert to list if multiple same-tag children
+                result[tag] = [result[tag], child_data]
+
+            # Children are filled in place - child_data is already linked into result
+            if len(child):
+                stack.append((child_data, iter(child)))
+                break
+        else:
+            stack.pop()
+
+    return root
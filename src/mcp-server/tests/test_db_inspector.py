@@ -6,7 +6,6 @@ Tests DBConfig, DBInspector, and schema formatting functionality.
 
 import time
 import pytest
-from dataclasses import asdict
 
 from chainguard.db_inspector import (
     DBConfig,
@@ -15,10 +14,44 @@ from chainguard.db_inspector import (
     TableInfo,
     SchemaInfo,
     get_inspector,
-    clear_inspector
+    clear_inspector,
+    _PASSWORD_SPECIAL_CHARS
 )
 
 
+# Shared read-only schema; tests that mutate a schema build their own.
+@pytest.fixture(scope="module")
+def blog_schema():
+    """MySQL schema with a users table and a posts table referencing it."""
+    schema = SchemaInfo(
+        database="testdb",
+        db_type="mysql",
+        version="8.0",
+        cached_at=time.time()
+    )
+
+    # Add users table
+    users = TableInfo(name="users", row_count=10)
+    users.columns = [
+        ColumnInfo(name="id", type="INT", key="PRI", extra="auto_increment"),
+        ColumnInfo(name="username", type="VARCHAR(255)", key="UNI"),
+        ColumnInfo(name="email", type="VARCHAR(255)")
+    ]
+    schema.tables["users"] = users
+
+    # Add posts table with foreign key
+    posts = TableInfo(name="posts", row_count=50)
+    posts.columns = [
+        ColumnInfo(name="id", type="INT", key="PRI"),
+        ColumnInfo(name="user_id", type="INT", fk_ref="users.id"),
+        ColumnInfo(name="title", type="VARCHAR(255)")
+    ]
+    posts.foreign_keys["user_id"] = "users.id"
+    schema.tables["posts"] = posts
+
+    return schema
+
+
 class TestDBConfig:
     """Tests for DBConfig dataclass."""
 
@@ -203,37 +236,11 @@ class TestDBInspector:
         result = inspector.format_schema(None)
         assert "Kein Schema" in result
 
-    def test_format_schema_with_tables(self):
+    def test_format_schema_with_tables(self, blog_schema):
         """Test formatting schema with tables."""
         inspector = DBInspector()
 
-        schema = SchemaInfo(
-            database="testdb",
-            db_type="mysql",
-            version="8.0",
-            cached_at=time.time()
-        )
-
-        # Add users table
-        users = TableInfo(name="users", row_count=10)
-        users.columns = [
-            ColumnInfo(name="id", type="INT", key="PRI", extra="auto_increment"),
-            ColumnInfo(name="username", type="VARCHAR(255)", key="UNI"),
-            ColumnInfo(name="email", type="VARCHAR(255)")
-        ]
-        schema.tables["users"] = users
-
-        # Add posts table with foreign key
-        posts = TableInfo(name="posts", row_count=50)
-        posts.columns = [
-            ColumnInfo(name="id", type="INT", key="PRI"),
-            ColumnInfo(name="user_id", type="INT", fk_ref="users.id"),
-            ColumnInfo(name="title", type="VARCHAR(255)")
-        ]
-        posts.foreign_keys["user_id"] = "users.id"
-        schema.tables["posts"] = posts
-
-        result = inspector.format_schema(schema)
+        result = inspector.format_schema(blog_schema)
 
         # Check output contains expected elements
         assert "testdb" in result
@@ -245,6 +252,19 @@ class TestDBInspector:
         assert "FK→users.id" in result
         assert "UNIQUE" in result
 
+    async def test_get_table_details_from_cached_schema(self, blog_schema):
+        """Test table details are rendered from a fresh cached schema."""
+        inspector = DBInspector()
+        inspector._config = DBConfig(database="testdb")
+        inspector._schema = blog_schema
+
+        details = await inspector.get_table_details("posts")
+        assert "## posts" in details
+        assert "- user_id: INT FK→users.id" in details
+        assert "### Foreign Keys" in details
+
+        assert await inspector.get_table_details("missing") is None
+
 
 class TestInspectorRegistry:
     """Tests for global inspector registry functions."""
@@ -277,6 +297,17 @@ class TestInspectorRegistry:
         new_inspector = get_inspector("project_to_clear")
         assert not new_inspector.is_connected()
 
+    def test_clear_inspector_releases_schema(self):
+        """Test that clearing drops the registry entry and cached schema."""
+        inspector = get_inspector("project_release")
+        inspector._schema = SchemaInfo(database="big", db_type="mysql")
+
+        clear_inspector("project_release")
+
+        assert inspector._schema is None
+        assert get_inspector("project_release") is not inspector
+        clear_inspector("project_release")
+
     def test_clear_nonexistent_inspector(self):
         """Test clearing non-existent inspector doesn't error."""
         # Should not raise
@@ -331,6 +362,22 @@ class TestSchemaFormatting:
         result = inspector.format_schema(schema)
         assert "AUTO" in result  # Serial should show as AUTO
 
+    def test_format_schema_reuses_body_until_refresh(self):
+        """Test that repeated formatting is cached until cached_at changes."""
+        inspector = DBInspector()
+        schema = SchemaInfo(database="db", db_type="mysql", version="8.0", cached_at=1.0)
+        schema.tables["users"] = TableInfo(
+            name="users", columns=[ColumnInfo(name="id", type="int", key="PRI")]
+        )
+
+        first = inspector.format_schema(schema)
+        assert inspector.format_schema(schema) == first
+
+        # Simulate a refetch: new columns plus a new timestamp
+        schema.tables["users"].columns.append(ColumnInfo(name="email", type="varchar"))
+        schema.cached_at = 2.0
+        assert "email" in inspector.format_schema(schema)
+
 
 class TestCacheTTL:
     """Tests for schema cache TTL behavior."""
@@ -414,20 +461,23 @@ class TestPasswordSpecialChars:
             "unicode\u00e4\u00f6\u00fc",
         ]
 
-        for original_pw in passwords_to_test:
-            config = DBConfig(user="u", password=original_pw, database="db")
+        payload = {
+            pw: DBConfig(user="u", password=pw, database="db").to_dict()
+            for pw in passwords_to_test
+        }
 
-            # JSON roundtrip (like MCP parameter passing)
-            json_str = json.dumps(config.to_dict())
-            restored_dict = json.loads(json_str)
-            restored = DBConfig.from_dict(restored_dict)
+        # One JSON roundtrip for all configs (like MCP parameter passing)
+        restored = {
+            pw: DBConfig.from_dict(d)
+            for pw, d in json.loads(json.dumps(payload)).items()
+        }
 
-            assert restored.password == original_pw, f"Failed for: {original_pw}"
+        assert restored.keys() == payload.keys()
+        for original_pw in passwords_to_test:
+            assert restored[original_pw].password == original_pw, f"Failed for: {original_pw}"
 
     def test_password_special_char_detection(self):
         """Test detection of special characters in password."""
-        special_chars = '!@#$%^&*()'
-
         test_cases = [
             ("simplepass", False),
             ("pass!word", True),
@@ -437,5 +487,5 @@ class TestPasswordSpecialChars:
         ]
 
         for password, expected_has_special in test_cases:
-            has_special = bool(password and any(c in password for c in special_chars))
+            has_special = not _PASSWORD_SPECIAL_CHARS.isdisjoint(password)
             assert has_special == expected_has_special, f"Failed for: {password}"
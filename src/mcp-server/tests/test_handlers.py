@@ -6,6 +6,7 @@ Tests HandlerRegistry and individual handler functions.
 
 import pytest
 import sys
+import tempfile
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime
 from dataclasses import dataclass
@@ -48,6 +49,7 @@ from chainguard.handlers import (
     handle_recall,
     handle_history,
     handle_learn,
+    handle_kanban_update,
 )
 from chainguard.models import ScopeDefinition, ProjectState
 from chainguard.config import CONTEXT_MARKER, CONTEXT_REFRESH_TEXT
@@ -1013,3 +1015,45 @@ class TestHandleLearn:
 
                 assert "✓" in result[0].text or "dokumentiert" in result[0].text
                 hm_mock.update_resolution.assert_called_once()
+
+
+class TestHandleKanbanUpdate:
+    """Tests for handle_kanban_update handler."""
+
+    @pytest.fixture
+    def kanban_dir(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            yield tmp
+
+    async def _update(self, kanban_dir, args):
+        with patch('chainguard.handlers.pm') as pm_mock:
+            pm_mock.resolve_working_dir_async = AsyncMock(return_value=kanban_dir)
+            result = await handle_kanban_update({"working_dir": kanban_dir, **args})
+        return result[0].text
+
+    @pytest.mark.asyncio
+    async def test_update_warns_on_dependency_cycle(self, kanban_dir):
+        """Test a depends_on update that closes a cycle is reported."""
+        km = handlers_module.kanban_manager
+        a = km.add_card(kanban_dir, "A")
+        b = km.add_card(kanban_dir, "B", depends_on=[a.id])
+
+        text = await self._update(kanban_dir, {"card_id": a.id, "depends_on": [b.id]})
+
+        assert "updated" in text
+        assert "Zyklische Abhängigkeit" in text
+        assert a.id in text and b.id in text
+
+    @pytest.mark.asyncio
+    async def test_update_without_cycle_has_no_warning(self, kanban_dir):
+        """Test a plain dependency update, with a null depends_on card on the board."""
+        km = handlers_module.kanban_manager
+        a = km.add_card(kanban_dir, "A")
+        b = km.add_card(kanban_dir, "B")
+        legacy = km.add_card(kanban_dir, "Legacy")
+        legacy.depends_on = None  # as loaded from a hand-edited "depends_on: null"
+
+        text = await self._update(kanban_dir, {"card_id": b.id, "depends_on": [a.id]})
+
+        assert "updated" in text
+        assert "Zyklische" not in text
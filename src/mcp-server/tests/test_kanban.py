@@ -9,6 +9,8 @@ Tests:
 - Archive functionality
 """
 
+import os
+import uuid
 import pytest
 import tempfile
 import shutil
@@ -17,7 +19,8 @@ from datetime import datetime
 
 from chainguard.kanban import (
     KanbanCard, KanbanBoard, KanbanManager,
-    CardPriority, DEFAULT_COLUMNS, COLUMN_PRESETS, YAML_AVAILABLE
+    CardPriority, DEFAULT_COLUMNS, COLUMN_PRESETS, YAML_AVAILABLE, _BOARD_CACHE,
+    _ARCHIVE_CACHE
 )
 
 
@@ -25,20 +28,45 @@ from chainguard.kanban import (
 # Fixtures
 # =============================================================================
 
+@pytest.fixture(scope="session")
+def kanban_root():
+    """Create one temporary root for all kanban tests, removed at session end."""
+    root = tempfile.mkdtemp(prefix="kanban_suite_")
+    yield root
+    shutil.rmtree(root, ignore_errors=True)
+
+
 @pytest.fixture
-def temp_dir():
-    """Create a temporary directory for testing."""
-    dir_path = tempfile.mkdtemp(prefix="kanban_test_")
+def temp_dir(kanban_root):
+    """Create a fresh project directory under the session root.
+
+    Cached boards and archives for the directory are dropped afterwards so
+    the shared caches do not grow across the suite.
+    """
+    dir_path = os.path.join(kanban_root, uuid.uuid4().hex)
+    os.mkdir(dir_path)
     yield dir_path
-    shutil.rmtree(dir_path, ignore_errors=True)
+    for cache in (_BOARD_CACHE, _ARCHIVE_CACHE):
+        for key in [k for k in cache if k.startswith(dir_path)]:
+            del cache[key]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def manager():
-    """Create a fresh KanbanManager instance."""
+    """Share one KanbanManager per module (boards live in the module cache)."""
     return KanbanManager()
 
 
+@pytest.fixture(autouse=True)
+def _reset_manager(request):
+    """Make sure no test leaves the shared manager inside a batch."""
+    yield
+    if "manager" in request.fixturenames:
+        mgr = request.getfixturevalue("manager")
+        assert not mgr._batch_depth
+        mgr._pending_saves.clear()
+
+
 # =============================================================================
 # KanbanCard Tests
 # =============================================================================
@@ -138,6 +166,51 @@ class TestKanbanBoard:
         not_found = board.get_card("notexist")
         assert not_found is None
 
+    def test_board_remove_card(self):
+        """Test removing a card by ID."""
+        board = KanbanBoard()
+        board.cards.append(KanbanCard(id="keep", title="Keep"))
+        board.cards.append(KanbanCard(id="drop", title="Drop"))
+
+        removed = board.remove_card("drop")
+        assert removed.title == "Drop"
+        assert board.get_card("drop") is None
+        assert [c.id for c in board.cards] == ["keep"]
+        assert board.remove_card("drop") is None
+
+    def test_board_remove_card_duplicate_id(self):
+        """Test a later card with the same id is found after removal."""
+        board = KanbanBoard()
+        board.cards.append(KanbanCard(id="dup", title="First"))
+        board.cards.append(KanbanCard(id="other", title="Other"))
+        board.cards.append(KanbanCard(id="dup", title="Second"))
+
+        assert board.remove_card("dup").title == "First"
+        assert board.get_card("dup").title == "Second"
+        assert board.get_card("other").title == "Other"
+
+    def test_board_remove_card_after_direct_edits(self):
+        """Test remove_card only reports cards it actually removed."""
+        board = KanbanBoard()
+        board.cards.append(KanbanCard(id="a", title="A"))
+        board.cards.append(KanbanCard(id="b", title="B"))
+
+        board.cards.pop(0)
+        board.cards.append(KanbanCard(id="c", title="C"))
+
+        assert board.remove_card("a") is None
+        assert [c.id for c in board.cards] == ["b", "c"]
+        assert board.remove_card("c").title == "C"
+        assert [c.id for c in board.cards] == ["b"]
+
+    def test_board_dependency_cycles_with_null_depends_on(self):
+        """Test an explicit depends_on: null from a hand-edited board is tolerated."""
+        board = KanbanBoard.from_dict({"cards": [
+            {"id": "a", "title": "A", "depends_on": None},
+            {"id": "b", "title": "B", "depends_on": ["a"]},
+        ]})
+        assert board.find_dependency_cycles() == []
+
     def test_board_get_cards_by_column(self):
         """Test filtering cards by column."""
         board = KanbanBoard()
@@ -156,6 +229,22 @@ class TestKanbanBoard:
         done = board.get_cards_by_column("done")
         assert len(done) == 0
 
+    def test_board_group_by_column(self):
+        """Test grouping all cards by column in one pass."""
+        board = KanbanBoard()
+        board.cards.extend([
+            KanbanCard(id="1", title="Task 1", column="backlog"),
+            KanbanCard(id="2", title="Task 2", column="review"),
+            KanbanCard(id="3", title="Task 3", column="backlog"),
+            KanbanCard(id="4", title="Task 4", column="legacy"),
+        ])
+
+        groups = board.group_by_column()
+        assert list(groups)[:len(DEFAULT_COLUMNS)] == DEFAULT_COLUMNS
+        assert [c.id for c in groups["backlog"]] == ["1", "3"]
+        assert groups["done"] == []
+        assert [c.id for c in groups["legacy"]] == ["4"]
+
     def test_board_to_dict(self):
         """Test board serialization."""
         board = KanbanBoard()
@@ -199,13 +288,75 @@ class TestKanbanManager:
         # Add a card and save
         card = manager.add_card(temp_dir, "Persist Test")
 
-        # Create new manager to clear cache
+        # Drop the shared board cache so the new manager reads from disk
+        _BOARD_CACHE.clear()
         manager2 = KanbanManager()
         board = manager2.load_board(temp_dir)
 
         assert len(board.cards) == 1
         assert board.cards[0].title == "Persist Test"
 
+    def test_saved_board_is_valid_yaml(self, manager, temp_dir):
+        """Test the board file (JSON-style) still parses as YAML."""
+        import yaml
+
+        manager.add_card(temp_dir, "Ünïcode title", tags=["a"])
+        kanban_path = Path(temp_dir) / ".claude" / "kanban.yaml"
+        data = yaml.safe_load(kanban_path.read_text(encoding="utf-8"))
+        assert data["cards"][0]["title"] == "Ünïcode title"
+        assert data["cards"][0]["tags"] == ["a"]
+
+    def test_save_board_leaves_no_temp_file(self, manager, temp_dir):
+        """Test the atomic write replaces kanban.yaml and cleans up."""
+        manager.add_card(temp_dir, "One")
+        manager.add_card(temp_dir, "Two")
+        kanban_dir = Path(temp_dir) / ".claude"
+        assert sorted(p.name for p in kanban_dir.iterdir()) == ["cards", "kanban.yaml"]
+
+    def test_failed_save_removes_temp_file(self, manager, temp_dir, monkeypatch):
+        """Test a failed replace cleans up its uniquely named temp file."""
+        manager.add_card(temp_dir, "One")
+        kanban_dir = Path(temp_dir) / ".claude"
+
+        def failing_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr("chainguard.kanban.os.replace", failing_replace)
+        with pytest.raises(OSError):
+            manager._write_yaml(kanban_dir / "kanban.yaml", {"cards": []})
+        assert sorted(p.name for p in kanban_dir.iterdir()) == ["cards", "kanban.yaml"]
+
+    def test_load_legacy_block_yaml(self, manager, temp_dir):
+        """Test boards stored as block-style YAML are still loaded."""
+        kanban_dir = Path(temp_dir) / ".claude"
+        kanban_dir.mkdir()
+        (kanban_dir / "kanban.yaml").write_text(
+            "columns:\n- todo\n- done\n"
+            "cards:\n- id: abc12345\n  title: Legacy\n  column: todo\n",
+            encoding="utf-8"
+        )
+
+        board = manager.load_board(temp_dir)
+        assert board.columns == ["todo", "done"]
+        assert board.get_card("abc12345").title == "Legacy"
+
+    def test_load_board_shared_between_managers(self, manager, temp_dir):
+        """Test that managers share parsed boards while the file is unchanged."""
+        manager.add_card(temp_dir, "Shared")
+        assert KanbanManager().load_board(temp_dir) is manager.load_board(temp_dir)
+
+    def test_load_board_reloads_after_external_edit(self, manager, temp_dir):
+        """Test that a board edited on disk is re-read instead of served stale."""
+        manager.add_card(temp_dir, "Original")
+        kanban_path = Path(temp_dir) / ".claude" / "kanban.yaml"
+        kanban_path.write_text(
+            kanban_path.read_text(encoding="utf-8").replace("Original", "Edited externally"),
+            encoding="utf-8"
+        )
+
+        board = manager.load_board(temp_dir)
+        assert board.cards[0].title == "Edited externally"
+
     def test_add_card_basic(self, manager, temp_dir):
         """Test adding a basic card."""
         card = manager.add_card(temp_dir, "Basic Card")
@@ -241,6 +392,33 @@ class TestKanbanManager:
         assert "My Task" in detail
         assert "Details here" in detail
 
+    def test_card_detail_missing_file(self, manager, temp_dir):
+        """Test a removed detail file reads as no detail."""
+        card = manager.add_card(temp_dir, "Detail Card", detail_content="Content")
+        os.remove(Path(temp_dir) / ".claude" / card.detail_file)
+
+        assert manager.get_card_detail(temp_dir, card.id) is None
+
+    def test_add_cards_writes_once(self, manager, temp_dir, monkeypatch):
+        """Test bulk add returns cards in order and saves the board once."""
+        writes = []
+        original = manager._write_yaml
+
+        def recording_write(path, data):
+            writes.append(path)
+            original(path, data)
+
+        monkeypatch.setattr(manager, "_write_yaml", recording_write)
+        cards = manager.add_cards(temp_dir, [
+            {"title": "First"},
+            {"title": "Second", "priority": "high", "column": "review"},
+        ])
+
+        assert [c.title for c in cards] == ["First", "Second"]
+        assert cards[1].column == "review"
+        assert len(writes) == 1
+        assert [c.id for c in manager.load_board(temp_dir).cards] == [c.id for c in cards]
+
     def test_move_card(self, manager, temp_dir):
         """Test moving a card to different column."""
         card = manager.add_card(temp_dir, "Move Me")
@@ -319,6 +497,32 @@ class TestKanbanManager:
         archive_view = manager.get_archive_view(temp_dir)
         assert card_id in archive_view
 
+    def test_batch_defers_writes_until_exit(self, manager, temp_dir):
+        """Test that a batch writes the board once, when it exits."""
+        kanban_path = Path(temp_dir) / ".claude" / "kanban.yaml"
+
+        with manager.batch(temp_dir) as board:
+            for title in ("One", "Two", "Three"):
+                manager.add_card(temp_dir, title)
+            with manager.batch(temp_dir):
+                manager.add_card(temp_dir, "Nested")
+            assert not kanban_path.exists()
+            assert manager.board_exists(temp_dir)
+            assert len(board.cards) == 4
+
+        _BOARD_CACHE.clear()
+        reloaded = KanbanManager().load_board(temp_dir)
+        assert [c.title for c in reloaded.cards] == ["One", "Two", "Three", "Nested"]
+
+    def test_batch_init_board_preserves_cards(self, manager, temp_dir):
+        """Test init_board inside a batch sees cards added earlier in it."""
+        with manager.batch(temp_dir):
+            manager.add_card(temp_dir, "Task 1")
+            board = manager.init_board(temp_dir, columns=["todo", "done"])
+
+        assert len(board.cards) == 1
+        assert board.cards[0].column == "todo"
+
     def test_board_exists(self, manager, temp_dir):
         """Test board_exists check."""
         assert not manager.board_exists(temp_dir)
@@ -346,6 +550,15 @@ class TestBoardInitialization:
         assert board.columns == COLUMN_PRESETS["programming"]
         assert "testing" in board.columns
 
+    def test_init_board_preset_is_not_shared(self, manager, temp_dir):
+        """Test that editing a board's columns leaves the preset untouched."""
+        board = manager.init_board(temp_dir, preset="simple")
+        board.columns.append("archived")
+        assert COLUMN_PRESETS["simple"] == ["todo", "doing", "done"]
+
+        manager.get_available_presets()["simple"].append("x")
+        assert COLUMN_PRESETS["simple"] == ["todo", "doing", "done"]
+
     def test_init_board_preset_content(self, manager, temp_dir):
         """Test init_board with content preset."""
         board = manager.init_board(temp_dir, preset="content")
@@ -480,8 +693,10 @@ class TestDependencies:
 
     def test_multiple_dependencies(self, manager, temp_dir):
         """Test card with multiple dependencies."""
-        dep1 = manager.add_card(temp_dir, "Dep 1", column="done")
-        dep2 = manager.add_card(temp_dir, "Dep 2", column="in_progress")
+        dep1, dep2 = manager.add_cards(temp_dir, [
+            {"title": "Dep 1", "column": "done"},
+            {"title": "Dep 2", "column": "in_progress"},
+        ])
         child = manager.add_card(temp_dir, "Child", depends_on=[dep1.id, dep2.id])
 
         # Blocked because dep2 is not done
@@ -495,6 +710,35 @@ class TestDependencies:
         blocked = manager.get_blocked_cards(temp_dir)
         assert len(blocked) == 0
 
+    def test_no_dependency_cycles_in_chain(self, manager, temp_dir):
+        """Test a plain dependency chain is not reported as a cycle."""
+        with manager.batch(temp_dir):
+            a = manager.add_card(temp_dir, "A")
+            b = manager.add_card(temp_dir, "B", depends_on=[a.id])
+            manager.add_card(temp_dir, "C", depends_on=[a.id, b.id, "gone"])
+
+        assert manager.get_dependency_cycles(temp_dir) == []
+
+    def test_dependency_cycle_detected(self, manager, temp_dir):
+        """Test cards on a cycle and their dependents are reported."""
+        with manager.batch(temp_dir):
+            a = manager.add_card(temp_dir, "A")
+            b = manager.add_card(temp_dir, "B", depends_on=[a.id])
+            c = manager.add_card(temp_dir, "C", depends_on=[b.id])
+            free = manager.add_card(temp_dir, "Free")
+        manager.update_card(temp_dir, a.id, depends_on=[b.id])
+
+        cycle = manager.get_dependency_cycles(temp_dir)
+        assert set(cycle) == {a.id, b.id, c.id}
+        assert free.id not in cycle
+
+    def test_self_dependency_is_cycle(self, manager, temp_dir):
+        """Test a card depending on itself is reported."""
+        card = manager.add_card(temp_dir, "Self")
+        manager.update_card(temp_dir, card.id, depends_on=[card.id])
+
+        assert manager.get_dependency_cycles(temp_dir) == [card.id]
+
 
 # =============================================================================
 # Board View Tests
@@ -542,6 +786,18 @@ class TestBoardViews:
         view = manager.get_board_view(temp_dir)
         assert "⛓️" in view
 
+    def test_full_board_view_stats_and_blocked(self, manager, temp_dir):
+        """Test full view counts columns and marks blocked cards."""
+        parent = manager.add_card(temp_dir, "Parent")
+        manager.add_card(temp_dir, "Child", depends_on=[parent.id])
+        manager.add_card(temp_dir, "Finished", column="done")
+
+        view = manager.get_full_board_view(temp_dir)
+        assert "(1/3 done)" in view
+        assert "⛔ 1 blocked" in view
+        assert "BACKLOG (2)" in view
+        assert view.count("⛔ BLOCKED") == 1
+
     def test_archive_view_empty(self, manager, temp_dir):
         """Test empty archive view."""
         view = manager.get_archive_view(temp_dir)
@@ -556,6 +812,17 @@ class TestBoardViews:
         assert "To Archive" in view
         assert "Archiv" in view
 
+    def test_archive_view_tracks_archive_file(self, manager, temp_dir):
+        """Test archive view reflects new archivals and external edits."""
+        for title in ("First", "Second"):
+            card = manager.add_card(temp_dir, title)
+            manager.archive_card(temp_dir, card.id)
+        assert "(2 Cards)" in manager.get_archive_view(temp_dir)
+
+        archive_path = Path(temp_dir) / ".claude" / "archive.yaml"
+        archive_path.write_text("[]\n", encoding="utf-8")
+        assert "Leer" in manager.get_archive_view(temp_dir)
+
 
 # =============================================================================
 # CardPriority Enum Tests
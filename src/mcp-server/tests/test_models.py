@@ -5,8 +5,10 @@ Tests ScopeDefinition and ProjectState functionality.
 """
 
 import json
+from datetime import datetime
+
 import pytest
-from chainguard.models import ScopeDefinition, ProjectState
+from chainguard.models import HAS_ORJSON, ScopeDefinition, ProjectState
 
 
 class TestScopeDefinition:
@@ -65,6 +67,24 @@ class TestProjectState:
         assert data["project_name"] == "TestProject"
         assert data["phase"] == "unknown"
 
+    @pytest.mark.skipif(not HAS_ORJSON, reason="orjson not installed")
+    def test_to_json_matches_stdlib_fallback(self, monkeypatch):
+        """Test that the orjson path and the json fallback emit the same text."""
+        import chainguard.models as models_module
+        state = ProjectState(
+            project_id="test123",
+            project_name="Prüfprojekt",
+            project_path="/tmp/test"
+        )
+        state.recent_actions = ["edit", {"at": datetime(2026, 1, 2, 3, 4, 5)}]
+        state.test_results = {1: "ok"}
+        fast = state.to_json()
+        monkeypatch.setattr(models_module, "HAS_ORJSON", False)
+        slow = state.to_json()
+
+        assert fast == slow
+        assert json.loads(slow)["recent_actions"][1]["at"] == "2026-01-02 03:04:05"
+
     def test_from_dict_basic(self):
         """Test creating from dictionary."""
         data = {
@@ -128,6 +148,25 @@ class TestProjectState:
         assert state.test_config == {}
         assert state.criteria_status == {}
 
+    def test_from_dict_does_not_mutate_input(self):
+        """Test that from_dict leaves the caller's dict untouched."""
+        data = {
+            "project_id": "abc123",
+            "project_name": "MyProject",
+            "project_path": "/tmp",
+            "scope": {"description": "Test scope", "modules": ["*.py"]},
+            "files_modified": ["a.py", "b.py"],
+            "db_schema_checked": False,
+            "learnings": {"old": "stuff"},
+        }
+        snapshot = json.loads(json.dumps(data))
+        state = ProjectState.from_dict(data)
+
+        assert data == snapshot
+        assert state.files_changed == 2
+        assert state.scope.description == "Test scope"
+        assert state.db_schema_checked_at == ""
+
     def test_needs_validation(self):
         """Test needs_validation threshold check."""
         state = ProjectState(
@@ -167,6 +206,21 @@ class TestProjectState:
         assert state.check_file_in_scope("tests/test_main.py") is True
         assert state.check_file_in_scope("docs/readme.md") is False
 
+    def test_check_file_in_scope_follows_module_changes(self):
+        """Test suffix matches and that edited module lists are re-read."""
+        state = ProjectState(
+            project_id="test",
+            project_name="Test",
+            project_path="/tmp"
+        )
+        state.scope = ScopeDefinition(description="Test", modules=["Controller.php"])
+
+        assert state.check_file_in_scope("app/UserController.php") is True
+        assert state.check_file_in_scope("docs/readme.md") is False
+
+        state.scope.modules.append("docs/*")
+        assert state.check_file_in_scope("docs/readme.md") is True
+
     def test_add_action(self):
         """Test adding actions to recent_actions."""
         state = ProjectState(
@@ -301,6 +355,22 @@ class TestProjectState:
 
         assert len(state.changed_files) == 2
 
+    def test_add_changed_file_keeps_latest_in_order(self):
+        """Test the changed-file list is capped to the most recent files."""
+        from chainguard.config import MAX_CHANGED_FILES
+
+        state = ProjectState(
+            project_id="test",
+            project_name="Test",
+            project_path="/tmp"
+        )
+        for i in range(MAX_CHANGED_FILES + 3):
+            state.add_changed_file(f"file{i}.py")
+
+        assert len(state.changed_files) == MAX_CHANGED_FILES
+        assert state.changed_files[0] == "file3.py"
+        assert state.changed_files[-1] == f"file{MAX_CHANGED_FILES + 2}.py"
+
     def test_add_out_of_scope_file(self):
         """Test tracking out-of-scope files."""
         state = ProjectState(
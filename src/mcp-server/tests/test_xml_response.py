@@ -9,6 +9,7 @@ from chainguard.xml_response import (
     XMLResponse,
     ResponseStatus,
     xml_response,
+    xml_responses,
     xml_success,
     xml_error,
     xml_warning,
@@ -159,6 +160,20 @@ class TestXMLResponse:
         assert "<with_dash>" in xml
         assert "<_123numeric>" in xml
 
+    def test_sanitize_tag_names_repeated_keys(self):
+        """Test that repeated (memoized) keys sanitize consistently."""
+        for _ in range(3):
+            xml = XMLResponse(
+                tool="test",
+                status=ResponseStatus.SUCCESS,
+                data={"file name": "a", "Größe": "b", "a/b": "c"}
+            ).to_xml()
+
+            assert is_valid_xml(xml)
+            assert "<file_name>a</file_name>" in xml
+            assert "<Größe>b</Größe>" in xml
+            assert "<ab>c</ab>" in xml
+
 
 # =============================================================================
 # ResponseStatus Tests
@@ -265,6 +280,44 @@ class TestConvenienceFunctions:
         assert "<context" in xml
 
 
+# =============================================================================
+# Batch Response Tests
+# =============================================================================
+
+class TestBatchResponses:
+    """Tests for xml_responses batching."""
+
+    def test_multiple_responses_wrapped(self):
+        """Test that each item becomes one <chainguard> element under the root."""
+        xml = xml_responses([
+            ("kanban_add", ResponseStatus.SUCCESS, "Card added", {"id": "a1"}),
+            ("kanban_add", ResponseStatus.ERROR, "Title missing"),
+        ])
+
+        assert is_valid_xml(xml)
+        assert xml.startswith("<results>")
+        assert xml.count("<chainguard ") == 2
+        assert "<id>a1</id>" in xml
+        assert "<status>error</status>" in xml
+
+    def test_matches_single_responses(self):
+        """Test batched output equals concatenated single responses."""
+        items = [
+            ("track", ResponseStatus.INFO, "", {"file": "a.py"}),
+            ("track", ResponseStatus.WARNING, "Out of scope"),
+        ]
+        single = "".join(xml_response(*item) for item in items)
+
+        assert xml_responses(items, wrap_tag="batch") == f"<batch>{single}</batch>"
+
+    def test_empty_batch(self):
+        """Test empty batch produces an empty root element."""
+        xml = xml_responses([])
+
+        assert is_valid_xml(xml)
+        assert xml == "<results />"
+
+
 # =============================================================================
 # Context Builder Tests
 # =============================================================================
@@ -333,6 +386,31 @@ class TestValidation:
         assert not is_valid_xml("not xml at all")
         assert not is_valid_xml("<root attr=value/>")  # Unquoted attribute
 
+    def test_is_valid_xml_entities_match_elementtree(self):
+        """Test entity and namespace handling agrees with ET.fromstring."""
+        import xml.etree.ElementTree as ET
+        samples = [
+            '<!DOCTYPE a [<!ENTITY e "v">]><a>&e;</a>',
+            '<!DOCTYPE a [<!ENTITY e SYSTEM "x">]><a>&e;</a>',
+            '<!DOCTYPE a SYSTEM "x.dtd"><a>&e;</a>',
+            '<!DOCTYPE a SYSTEM "x.dtd"><a/>',
+            "<a>&undefined;</a>",
+            "<a>&amp;&#65;</a>",
+            # Namespace checks
+            "<a:b/>",
+            "<r><x:y>1</x:y></r>",
+            '<r a:b="1"/>',
+            '<r xmlns:a="">x</r>',
+            '<r xmlns:a="urn:a"><a:b/></r>',
+        ]
+        for sample in samples:
+            try:
+                ET.fromstring(sample)
+                expected = True
+            except ET.ParseError:
+                expected = False
+            assert is_valid_xml(sample) is expected, sample
+
     def test_parse_xml_response_success(self):
         """Test parsing valid XML response."""
         xml = xml_success("test", "OK", {"value": "123"})
@@ -348,6 +426,23 @@ class TestValidation:
         assert parse_xml_response("not xml") is None
         assert parse_xml_response("<broken><xml>") is None
 
+    def test_parse_deeply_nested_xml(self):
+        """Test parsing nesting deeper than the recursion limit."""
+        depth = 2000
+        xml = "<n>" * depth + "leaf" + "</n>" * depth
+        parsed = parse_xml_response(xml)
+
+        for _ in range(depth - 2):
+            parsed = parsed["n"]
+        assert parsed["n"] == "leaf"
+
+    def test_parse_repeated_tags_become_list(self):
+        """Test that repeated child tags are collected into a list."""
+        parsed = parse_xml_response("<r><i>1</i><i>2</i><i>3</i><j>x</j></r>")
+
+        assert parsed["i"] == ["1", "2", "3"]
+        assert parsed["j"] == "x"
+
     def test_parse_xml_preserves_attributes(self):
         """Test that parsing preserves XML attributes."""
         xml = '<chainguard tool="test" version="6.0"><status>info</status></chainguard>'
@@ -433,6 +528,22 @@ class TestEdgeCases:
         assert "<enabled>true</enabled>" in xml
         assert "<disabled>false</disabled>" in xml
 
+    def test_container_subclasses(self):
+        """Test dict/list subclasses render like their base types."""
+        from collections import OrderedDict
+
+        class Tags(list):
+            pass
+
+        xml = xml_info(
+            tool="test",
+            data={"meta": OrderedDict(owner="me"), "tag": Tags(["a", "b"])}
+        )
+
+        assert is_valid_xml(xml)
+        assert "<meta><owner>me</owner></meta>" in xml
+        assert "<tag>a</tag><tag>b</tag>" in xml
+
     def test_mixed_list_content(self):
         """Test lists with mixed content types."""
         xml = xml_info(
@@ -483,8 +594,8 @@ class TestIntegration:
             )
         )
 
-        assert is_valid_xml(xml)
         parsed = parse_xml_response(xml)
+        assert parsed is not None  # None means the XML did not parse
         assert parsed["status"] == "success"
         assert "scope" in parsed["data"]
 